@@ -9,18 +9,24 @@ import json
 import time
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, is_dataclass
 from pathlib import Path
 import logging
-import numpy as np
-import pandas as pd
+import sys
 from enum import Enum
+from statistics import fmean
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional; se usa json estándar como respaldo
+    orjson = None
 
 # Configuración de logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class BenchmarkCategory(Enum):
+class BenchmarkCategory(str, Enum):
     """Categorías de benchmarks"""
     GENERAL_AI = "general_ai"
     AGI_SPECIFIC = "agi_specific"
@@ -28,7 +34,10 @@ class BenchmarkCategory(Enum):
     PERFORMANCE = "performance"
     SAFETY = "safety"
 
-@dataclass
+# Orden canónico de las categorías, materializado una sola vez
+_ALL_CATEGORIES = tuple(BenchmarkCategory)
+
+@dataclass(slots=True, frozen=True)
 class BenchmarkResult:
     """Resultado de un benchmark individual"""
     benchmark_name: str
@@ -41,7 +50,7 @@ class BenchmarkResult:
     timestamp: str
     passed: bool
 
-@dataclass
+@dataclass(slots=True)
 class ComprehensiveEvaluation:
     """Evaluación completa de AION-CR"""
     system_name: str = "AION-CR"
@@ -55,59 +64,684 @@ class ComprehensiveEvaluation:
     performance_metrics: Dict[str, Any] = None
     recommendations: List[str] = None
 
+# Capacidades conocidas de AION-CR (inmutables, compartidas por todas las instancias)
+_AION_CR_CAPABILITIES = MappingProxyType({
+    # Capacidades de rendimiento actuales
+    "response_time_ms": 78,
+    "throughput_req_per_sec": 12847,
+    "memory_usage_mb": 387,
+    "concurrent_users": 1456,
+
+    # Capacidades cognitivas
+    "legal_reasoning_accuracy": 0.947,
+    "cross_domain_transfer": 0.89,
+    "creative_solution_generation": 0.78,
+    "meta_cognitive_calibration": 0.92,
+
+    # Capacidades de seguridad
+    "bias_detection_accuracy": 0.976,
+    "privacy_protection": 0.999,
+    "constitutional_compliance": 0.999,
+    "ethical_alignment": 0.987,
+
+    # Capacidades especializadas
+    "regulatory_frameworks_supported": 47,
+    "jurisdictions_covered": 23,
+    "compliance_accuracy": 0.952,
+    "conflict_detection_precision": 0.948,
+
+    # Bases de conocimiento
+    "total_regulations": 647,
+    "total_articles": 19875,
+    "legal_precedents": 53000,
+    "real_time_sources": 50
+})
+
+def _freeze(table: Any) -> Any:
+    """Envuelve recursivamente una tabla en vistas de solo lectura"""
+    if isinstance(table, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in table.items()})
+    if isinstance(table, list):
+        return tuple(_freeze(value) for value in table)
+    return table
+
+# Tablas estáticas de cada benchmark (se construyen una sola vez al importar)
+# Los detalles de cada resultado referencian estas tablas sin copiarlas, así
+# que se congelan para poder compartirlas de forma segura
+
+# Simular evaluación MLPerf basada en capacidades reales de AION-CR
+_MLPERF_TASKS = _freeze({
+    "language_modeling": {
+        "task": "Legal text completion and understanding",
+        "metric": "perplexity",
+        "aion_score": 2.1,  # Lower is better for perplexity
+        "baseline": 3.5,
+        "percentile": 92.3
+    },
+    "question_answering": {
+        "task": "Regulatory compliance Q&A",
+        "metric": "exact_match",
+        "aion_score": 0.894,
+        "baseline": 0.750,
+        "percentile": 88.7
+    },
+    "text_classification": {
+        "task": "Legal document classification",
+        "metric": "f1_score",
+        "aion_score": 0.923,
+        "baseline": 0.850,
+        "percentile": 91.2
+    },
+    "information_retrieval": {
+        "task": "Regulatory search and retrieval",
+        "metric": "ndcg@10",
+        "aion_score": 0.876,
+        "baseline": 0.720,
+        "percentile": 89.4
+    }
+})
+
+_HELM_SCENARIOS = _freeze({
+    "reading_comprehension": {
+        "scenario": "Legal document comprehension",
+        "accuracy": 0.912,
+        "calibration": 0.923,
+        "robustness": 0.887
+    },
+    "question_answering": {
+        "scenario": "Regulatory compliance questions",
+        "accuracy": 0.894,
+        "calibration": 0.902,
+        "robustness": 0.869
+    },
+    "summarization": {
+        "scenario": "Legal case and regulation summaries",
+        "rouge_l": 0.456,
+        "factuality": 0.891,
+        "coverage": 0.823
+    },
+    "sentiment_analysis": {
+        "scenario": "Legal opinion sentiment",
+        "accuracy": 0.867,
+        "calibration": 0.843,
+        "robustness": 0.791
+    },
+    "toxicity_detection": {
+        "scenario": "Legal content safety",
+        "accuracy": 0.943,
+        "calibration": 0.956,
+        "robustness": 0.912
+    }
+})
+
+# Seleccionar tareas relevantes para AION-CR
+_BIG_BENCH_TASKS = _freeze({
+    "legal_support": {
+        "description": "Legal reasoning and support",
+        "score": 0.847,
+        "human_baseline": 0.720,
+        "random_baseline": 0.250
+    },
+    "logical_deduction": {
+        "description": "Multi-step logical reasoning",
+        "score": 0.823,
+        "human_baseline": 0.890,
+        "random_baseline": 0.333
+    },
+    "causal_judgement": {
+        "description": "Causal reasoning in scenarios",
+        "score": 0.756,
+        "human_baseline": 0.820,
+        "random_baseline": 0.500
+    },
+    "formal_fallacies": {
+        "description": "Detecting logical fallacies",
+        "score": 0.789,
+        "human_baseline": 0.750,
+        "random_baseline": 0.500
+    },
+    "navigate": {
+        "description": "Navigation in complex rule spaces",
+        "score": 0.912,
+        "human_baseline": 0.850,
+        "random_baseline": 0.200
+    },
+    "reasoning_about_colored_objects": {
+        "description": "Systematic reasoning",
+        "score": 0.834,
+        "human_baseline": 0.900,
+        "random_baseline": 0.100
+    },
+    "ruin_names": {
+        "description": "Understanding semantic changes",
+        "score": 0.667,
+        "human_baseline": 0.780,
+        "random_baseline": 0.500
+    },
+    "salient_translation_error_detection": {
+        "description": "Translation quality assessment",
+        "score": 0.823,
+        "human_baseline": 0.890,
+        "random_baseline": 0.500
+    }
+})
+
+# GLUE tasks adaptadas para dominio legal
+_GLUE_TASKS = _freeze({
+    "cola": {  # Corpus of Linguistic Acceptability
+        "task": "Legal text grammatical acceptability",
+        "metric": "matthews_corr",
+        "score": 0.847,
+        "human_baseline": 0.690
+    },
+    "sst2": {  # Stanford Sentiment Treebank
+        "task": "Legal document sentiment",
+        "metric": "accuracy",
+        "score": 0.923,
+        "human_baseline": 0.970
+    },
+    "mrpc": {  # Microsoft Research Paraphrase Corpus
+        "task": "Legal text paraphrase detection",
+        "metric": "f1",
+        "score": 0.889,
+        "human_baseline": 0.860
+    },
+    "qqp": {  # Quora Question Pairs
+        "task": "Legal question similarity",
+        "metric": "f1",
+        "score": 0.901,
+        "human_baseline": 0.800
+    },
+    "mnli": {  # Multi-Genre Natural Language Inference
+        "task": "Legal text entailment",
+        "metric": "accuracy",
+        "score": 0.834,
+        "human_baseline": 0.920
+    },
+    "qnli": {  # Question Natural Language Inference
+        "task": "Legal Q&A inference",
+        "metric": "accuracy",
+        "score": 0.887,
+        "human_baseline": 0.910
+    },
+    "rte": {  # Recognizing Textual Entailment
+        "task": "Legal textual entailment",
+        "metric": "accuracy",
+        "score": 0.798,
+        "human_baseline": 0.930
+    }
+})
+
+# SuperGLUE tasks (más desafiantes)
+_SUPERGLUE_TASKS = _freeze({
+    "boolq": {  # Boolean Questions
+        "task": "Legal yes/no questions",
+        "metric": "accuracy",
+        "score": 0.823,
+        "human_baseline": 0.890
+    },
+    "cb": {  # CommitmentBank
+        "task": "Legal commitment analysis",
+        "metric": "f1",
+        "score": 0.756,
+        "human_baseline": 0.950
+    },
+    "copa": {  # Choice of Plausible Alternatives
+        "task": "Legal causal reasoning",
+        "metric": "accuracy",
+        "score": 0.812,
+        "human_baseline": 0.940
+    },
+    "multirc": {  # Multi-Sentence Reading Comprehension
+        "task": "Legal multi-sentence comprehension",
+        "metric": "f1",
+        "score": 0.789,
+        "human_baseline": 0.900
+    },
+    "wic": {  # Word-in-Context
+        "task": "Legal term disambiguation",
+        "metric": "accuracy",
+        "score": 0.734,
+        "human_baseline": 0.800
+    }
+})
+
+# ARC tasks adaptadas para razonamiento legal
+_ARC_SCENARIOS = _freeze({
+    "legal_analogical_reasoning": {
+        "description": "Reasoning by analogy in legal cases",
+        "questions_attempted": 342,
+        "correct_answers": 267,
+        "accuracy": 0.781,
+        "difficulty": "challenge"
+    },
+    "regulatory_pattern_recognition": {
+        "description": "Identifying patterns in regulations",
+        "questions_attempted": 298,
+        "correct_answers": 251,
+        "accuracy": 0.842,
+        "difficulty": "easy"
+    },
+    "causal_legal_reasoning": {
+        "description": "Cause-effect reasoning in legal contexts",
+        "questions_attempted": 187,
+        "correct_answers": 139,
+        "accuracy": 0.743,
+        "difficulty": "challenge"
+    },
+    "legal_common_sense": {
+        "description": "Common sense reasoning in legal scenarios",
+        "questions_attempted": 423,
+        "correct_answers": 356,
+        "accuracy": 0.841,
+        "difficulty": "easy"
+    }
+})
+
+_CONSTITUTIONAL_PRINCIPLES = _freeze({
+    "helpfulness": {
+        "description": "Providing useful legal assistance",
+        "evaluation_scenarios": 156,
+        "score": 0.923,
+        "weight": 0.35
+    },
+    "harmlessness": {
+        "description": "Avoiding harmful legal advice",
+        "evaluation_scenarios": 203,
+        "score": 0.967,
+        "weight": 0.35
+    },
+    "honesty": {
+        "description": "Truthful about legal uncertainty",
+        "evaluation_scenarios": 187,
+        "score": 0.891,
+        "weight": 0.30
+    }
+})
+
+_SAFETY_EVALUATIONS = _freeze({
+    "bias_mitigation": {
+        "demographic_bias": 0.976,
+        "jurisdictional_bias": 0.934,
+        "socioeconomic_bias": 0.912
+    },
+    "privacy_protection": {
+        "data_minimization": 0.989,
+        "purpose_limitation": 0.978,
+        "consent_handling": 0.967
+    },
+    "professional_ethics": {
+        "confidentiality": 0.995,
+        "conflict_of_interest": 0.987,
+        "competence_boundaries": 0.934
+    }
+})
+
+# Evaluaciones seleccionadas del repositorio OpenAI Evals
+_OPENAI_EVALS = _freeze({
+    "truthfulqa": {
+        "description": "Truthfulness in Q&A responses",
+        "questions": 817,
+        "truthful_answers": 712,
+        "accuracy": 0.871
+    },
+    "legal_reasoning": {
+        "description": "Legal reasoning capabilities",
+        "questions": 245,
+        "correct_answers": 207,
+        "accuracy": 0.845
+    },
+    "factuality_check": {
+        "description": "Factual accuracy verification",
+        "claims_evaluated": 1247,
+        "accurate_claims": 1156,
+        "accuracy": 0.927
+    },
+    "logical_consistency": {
+        "description": "Consistency in logical reasoning",
+        "scenarios": 398,
+        "consistent_responses": 342,
+        "accuracy": 0.859
+    },
+    "uncertainty_calibration": {
+        "description": "Confidence calibration accuracy",
+        "predictions": 1567,
+        "well_calibrated": 1432,
+        "accuracy": 0.914
+    }
+})
+
+# Categorías principales de LegalBench
+_LEGALBENCH_CATEGORIES = _freeze({
+    "rule_application": {
+        "tasks": 23,
+        "completed": 21,
+        "avg_accuracy": 0.847,
+        "examples": ["statutory_interpretation", "contract_terms", "tort_liability"]
+    },
+    "rule_conclusion": {
+        "tasks": 31,
+        "completed": 28,
+        "avg_accuracy": 0.823,
+        "examples": ["case_outcomes", "legal_holdings", "precedent_application"]
+    },
+    "rule_interpretation": {
+        "tasks": 28,
+        "completed": 25,
+        "avg_accuracy": 0.791,
+        "examples": ["constitutional_interpretation", "regulatory_meaning", "legislative_intent"]
+    },
+    "factual_analysis": {
+        "tasks": 34,
+        "completed": 31,
+        "avg_accuracy": 0.869,
+        "examples": ["evidence_evaluation", "witness_credibility", "fact_patterns"]
+    },
+    "legal_reasoning": {
+        "tasks": 46,
+        "completed": 42,
+        "avg_accuracy": 0.812,
+        "examples": ["analogical_reasoning", "causal_analysis", "policy_implications"]
+    }
+})
+
+# Categorías de análisis de contratos CUAD
+_CUAD_CATEGORIES = _freeze({
+    "parties_identification": {
+        "questions": 1247,
+        "correct_answers": 1156,
+        "accuracy": 0.927,
+        "f1_score": 0.934
+    },
+    "governing_law": {
+        "questions": 897,
+        "correct_answers": 789,
+        "accuracy": 0.879,
+        "f1_score": 0.891
+    },
+    "termination_clauses": {
+        "questions": 1156,
+        "correct_answers": 982,
+        "accuracy": 0.849,
+        "f1_score": 0.867
+    },
+    "liability_limitations": {
+        "questions": 934,
+        "correct_answers": 823,
+        "accuracy": 0.881,
+        "f1_score": 0.895
+    },
+    "payment_terms": {
+        "questions": 1067,
+        "correct_answers": 945,
+        "accuracy": 0.886,
+        "f1_score": 0.902
+    },
+    "intellectual_property": {
+        "questions": 823,
+        "correct_answers": 712,
+        "accuracy": 0.865,
+        "f1_score": 0.878
+    },
+    "confidentiality": {
+        "questions": 1234,
+        "correct_answers": 1098,
+        "accuracy": 0.890,
+        "f1_score": 0.904
+    }
+})
+
+# Análisis de holdings de casos legales
+_CASEHOLD_ANALYSIS = _freeze({
+    "holding_identification": {
+        "cases_analyzed": 4823,
+        "correct_holdings": 4234,
+        "accuracy": 0.878,
+        "legal_domains": ["constitutional", "contract", "tort", "criminal"]
+    },
+    "precedent_application": {
+        "precedent_cases": 2156,
+        "correctly_applied": 1876,
+        "accuracy": 0.870,
+        "citation_accuracy": 0.923
+    },
+    "legal_reasoning_chain": {
+        "reasoning_steps": 7834,
+        "valid_steps": 6912,
+        "accuracy": 0.882,
+        "logical_consistency": 0.891
+    },
+    "outcome_prediction": {
+        "case_predictions": 1967,
+        "correct_predictions": 1698,
+        "accuracy": 0.863,
+        "confidence_calibration": 0.847
+    }
+})
+
+# Análisis por jurisdicción
+_JURISDICTIONAL_PERFORMANCE = _freeze({
+    "federal_cases": {
+        "accuracy": 0.891,
+        "cases": 1823
+    },
+    "state_cases": {
+        "accuracy": 0.867,
+        "cases": 2134
+    },
+    "appellate_cases": {
+        "accuracy": 0.856,
+        "cases": 866
+    }
+})
+
+_PERFORMANCE_METRICS = _freeze({
+    "latency": {
+        "atomic_queries_ms": 78,
+        "complex_analysis_ms": 1834,
+        "real_time_alerts_ms": 156,
+        "target_atomic_ms": 100,
+        "target_complex_ms": 2000,
+        "target_alerts_ms": 200
+    },
+    "throughput": {
+        "requests_per_second": 12847,
+        "concurrent_users": 1456,
+        "target_rps": 10000,
+        "target_users": 1000
+    },
+    "resource_efficiency": {
+        "memory_usage_mb": 387,
+        "cpu_utilization_percent": 58.3,
+        "target_memory_mb": 512,
+        "target_cpu_percent": 70.0
+    },
+    "scalability": {
+        "max_tested_load": 15000,
+        "degradation_threshold": 12000,
+        "auto_scaling_efficiency": 0.923
+    }
+})
+
+_SAFETY_METRICS = _freeze({
+    "bias_evaluation": {
+        "demographic_bias_score": 0.976,
+        "gender_bias_score": 0.981,
+        "racial_bias_score": 0.967,
+        "age_bias_score": 0.973,
+        "socioeconomic_bias_score": 0.912
+    },
+    "privacy_protection": {
+        "data_minimization": 0.989,
+        "purpose_limitation": 0.978,
+        "consent_mechanisms": 0.967,
+        "anonymization_quality": 0.945
+    },
+    "robustness": {
+        "adversarial_resistance": 0.934,
+        "input_validation": 0.987,
+        "error_handling": 0.923,
+        "graceful_degradation": 0.956
+    },
+    "alignment": {
+        "value_alignment": 0.987,
+        "ethical_consistency": 0.972,
+        "professional_standards": 0.995,
+        "harm_prevention": 0.999
+    }
+})
+
+# Agregados de las tablas estáticas: son deterministas, se calculan al importar
+
+# Por debajo de este tamaño la sobrecarga de NumPy supera a Python puro
+_NUMPY_CROSSOVER = 100
+
+def _columns(table: Dict[str, Dict[str, Any]], *fields: str) -> Tuple[List[Any], ...]:
+    """Extrae varias columnas de una tabla recorriéndola una sola vez"""
+    columns = tuple([] for _ in fields)
+    for entry in table.values():
+        for column, field in zip(columns, fields):
+            column.append(entry[field])
+    return columns
+
+def _weighted_mean(values: List[float], weights: List[float]) -> float:
+    """Media ponderada; usa un producto escalar NumPy solo en tablas grandes"""
+    if len(values) >= _NUMPY_CROSSOVER:
+        import numpy as np  # importación diferida: solo la necesitan tablas grandes
+        values_arr = np.asarray(values, dtype=np.float64)
+        weights_arr = np.asarray(weights, dtype=np.float64)
+        return float(np.dot(values_arr, weights_arr) / weights_arr.sum())
+    return sum(v * w for v, w in zip(values, weights)) / sum(weights)
+
+def _ratio_of_sums(numerators: List[float], denominators: List[float]) -> float:
+    """Cociente de dos sumas; vectorizado con NumPy solo en tablas grandes"""
+    if len(numerators) >= _NUMPY_CROSSOVER:
+        import numpy as np  # importación diferida: solo la necesitan tablas grandes
+        return float(np.sum(numerators) / np.sum(denominators))
+    return sum(numerators) / sum(denominators)
+
+def _mean_ratio(numerators: List[float], denominators: List[float], scale: float = 1.0) -> float:
+    """Media de los cocientes elemento a elemento; vectorizada en tablas grandes"""
+    if len(numerators) >= _NUMPY_CROSSOVER:
+        import numpy as np  # importación diferida: solo la necesitan tablas grandes
+        ratios = np.asarray(numerators, dtype=np.float64) / np.asarray(denominators, dtype=np.float64)
+        return float((ratios * scale).mean())
+    return sum((n / d) * scale for n, d in zip(numerators, denominators)) / len(numerators)
+
+def _mlperf_score(tasks: Dict[str, Dict[str, Any]]) -> float:
+    """Media de aion_score/baseline normalizada a 100"""
+    aion_scores, baselines = _columns(tasks, "aion_score", "baseline")
+    return _mean_ratio(aion_scores, baselines, scale=100)
+
+def _helm_score(scenarios: Dict[str, Dict[str, Any]]) -> float:
+    """Media de las métricas de cada escenario, normalizada a 100"""
+    total_score = 0
+    for metrics in scenarios.values():
+        # Promediar solo las métricas numéricas (se omite la descripción)
+        total_score += fmean(v for k, v in metrics.items() if k != "scenario")
+    return (total_score / len(scenarios)) * 100
+
+def _human_performance_ratio(tasks: Dict[str, Dict[str, Any]]) -> float:
+    """Media del score relativo al human baseline"""
+    scores, human_baselines = _columns(tasks, "score", "human_baseline")
+    return _mean_ratio(scores, human_baselines)
+
+def _mean_field(entries: Dict[str, Dict[str, Any]], field: str) -> float:
+    """Media de un campo numérico sobre todas las entradas de una tabla"""
+    return fmean(entry[field] for entry in entries.values())
+
+def _mean_of_means(categories: Dict[str, Dict[str, float]]) -> float:
+    """Media de las medias de cada categoría"""
+    return fmean(fmean(category.values()) for category in categories.values())
+
+def _arc_accuracy(scenarios: Dict[str, Dict[str, Any]]) -> float:
+    """Precisión global: respuestas correctas sobre preguntas intentadas"""
+    correct, attempted = _columns(scenarios, "correct_answers", "questions_attempted")
+    return _ratio_of_sums(correct, attempted)
+
+def _constitutional_score(principles: Dict[str, Dict[str, Any]]) -> float:
+    """Suma ponderada de las puntuaciones de cada principio"""
+    return sum(
+        principle["score"] * principle["weight"]
+        for principle in principles.values()
+    )
+
+def _legalbench_aggregate(categories: Dict[str, Dict[str, Any]]) -> Tuple[int, int, float]:
+    """Tareas totales, tareas completadas y precisión ponderada por completadas"""
+    tasks, completed, accuracies = _columns(categories, "tasks", "completed", "avg_accuracy")
+    return sum(tasks), sum(completed), _weighted_mean(accuracies, completed)
+
+def _cuad_aggregate(questions: Tuple[int, ...], correct: Tuple[int, ...],
+                    f1_scores: Tuple[float, ...]) -> Tuple[int, float, float]:
+    """Preguntas totales, precisión global y F1 medio a partir de las columnas CUAD"""
+    total_questions = sum(questions)
+    return total_questions, sum(correct) / total_questions, fmean(f1_scores)
+
+def _performance_scores(metrics: Dict[str, Dict[str, Any]]) -> Tuple[float, float, float]:
+    """Puntuaciones de latencia, throughput y eficiencia (acotadas a 100)"""
+    latency_score = min(100, (metrics["latency"]["target_atomic_ms"] /
+                            metrics["latency"]["atomic_queries_ms"]) * 100)
+
+    throughput_score = min(100, (metrics["throughput"]["requests_per_second"] /
+                               metrics["throughput"]["target_rps"]) * 100)
+
+    efficiency_score = min(100, (metrics["resource_efficiency"]["target_memory_mb"] /
+                               metrics["resource_efficiency"]["memory_usage_mb"]) * 100)
+
+    return latency_score, throughput_score, efficiency_score
+
+_MLPERF_SCORE = _mlperf_score(_MLPERF_TASKS)
+_HELM_SCORE = _helm_score(_HELM_SCENARIOS)
+_BIG_BENCH_RATIO = _human_performance_ratio(_BIG_BENCH_TASKS)
+_GLUE_SCORE = _mean_field(_GLUE_TASKS, "score") * 100
+_SUPERGLUE_SCORE = _mean_field(_SUPERGLUE_TASKS, "score") * 100
+_ARC_ACCURACY = _arc_accuracy(_ARC_SCENARIOS)
+_CONSTITUTIONAL_SCORE = _constitutional_score(_CONSTITUTIONAL_PRINCIPLES)
+_CONSTITUTIONAL_SAFETY_SCORE = _mean_of_means(_SAFETY_EVALUATIONS)
+_CONSTITUTIONAL_AI_SCORE = (_CONSTITUTIONAL_SCORE + _CONSTITUTIONAL_SAFETY_SCORE) / 2 * 100
+_OPENAI_ACCURACY = _mean_field(_OPENAI_EVALS, "accuracy")
+_LEGALBENCH_TOTAL_TASKS, _LEGALBENCH_COMPLETED, _LEGALBENCH_ACCURACY = _legalbench_aggregate(_LEGALBENCH_CATEGORIES)
+# Columnas de la tabla CUAD (la tabla anidada se conserva solo para los detalles)
+_CUAD_QUESTIONS, _CUAD_CORRECT, _CUAD_F1 = (
+    tuple(column) for column in _columns(_CUAD_CATEGORIES, "questions", "correct_answers", "f1_score")
+)
+_CUAD_TOTAL_QUESTIONS, _CUAD_ACCURACY, _CUAD_F1_SCORE = _cuad_aggregate(_CUAD_QUESTIONS, _CUAD_CORRECT, _CUAD_F1)
+_CASEHOLD_ACCURACY = _mean_field(_CASEHOLD_ANALYSIS, "accuracy")
+_LATENCY_SCORE, _THROUGHPUT_SCORE, _EFFICIENCY_SCORE = _performance_scores(_PERFORMANCE_METRICS)
+_SAFETY_SCORE = _mean_of_means(_SAFETY_METRICS) * 100
+
 class AIONCRBenchmarkEvaluator:
     """Evaluador comprehensivo de benchmarks para AION-CR"""
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 8):
         self.results = []
-        self.start_time = None
-        self.aion_cr_capabilities = self._initialize_aion_capabilities()
-
-    def _initialize_aion_capabilities(self) -> Dict[str, Any]:
-        """Inicializa las capacidades conocidas de AION-CR"""
-        return {
-            # Capacidades de rendimiento actuales
-            "response_time_ms": 78,
-            "throughput_req_per_sec": 12847,
-            "memory_usage_mb": 387,
-            "concurrent_users": 1456,
-
-            # Capacidades cognitivas
-            "legal_reasoning_accuracy": 0.947,
-            "cross_domain_transfer": 0.89,
-            "creative_solution_generation": 0.78,
-            "meta_cognitive_calibration": 0.92,
-
-            # Capacidades de seguridad
-            "bias_detection_accuracy": 0.976,
-            "privacy_protection": 0.999,
-            "constitutional_compliance": 0.999,
-            "ethical_alignment": 0.987,
-
-            # Capacidades especializadas
-            "regulatory_frameworks_supported": 47,
-            "jurisdictions_covered": 23,
-            "compliance_accuracy": 0.952,
-            "conflict_detection_precision": 0.948,
-
-            # Bases de conocimiento
-            "total_regulations": 647,
-            "total_articles": 19875,
-            "legal_precedents": 53000,
-            "real_time_sources": 50
-        }
+        self.start_ns = None
+        self.run_timestamp = None
+        # Limita cuántos evaluadores se ejecutan a la vez cuando usen E/S real
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.aion_cr_capabilities = _AION_CR_CAPABILITIES
+        # Directorio de salida creado una sola vez por evaluador
+        self.output_dir = Path("evaluation_results")
+        self.output_dir.mkdir(exist_ok=True)
 
     async def run_comprehensive_evaluation(self) -> ComprehensiveEvaluation:
         """Ejecuta evaluación completa contra todos los frameworks"""
         logger.info("🚀 Starting AION-CR Comprehensive AI Benchmark Evaluation")
-        self.start_time = time.time()
-
-        # Ejecutar todas las categorías de benchmarks
-        await self._run_general_ai_benchmarks()
-        await self._run_agi_specific_benchmarks()
-        await self._run_legal_specialized_benchmarks()
-        await self._run_performance_benchmarks()
-        await self._run_safety_benchmarks()
+        self.start_ns = time.perf_counter_ns()
+        # Marca de tiempo única para todos los resultados de esta ejecución
+        self.run_timestamp = datetime.now(timezone.utc).isoformat()
+
+        # Ejecutar todas las categorías de benchmarks de forma concurrente;
+        # gather conserva el orden de los grupos en sus resultados
+        groups = await asyncio.gather(
+            self._run_general_ai_benchmarks(),
+            self._run_agi_specific_benchmarks(),
+            self._run_legal_specialized_benchmarks(),
+            self._run_performance_benchmarks(),
+            self._run_safety_benchmarks()
+        )
+        # Aplanar los grupos en una sola lista, sin escrituras compartidas
+        self.results = [result for group in groups for result in group]
 
         # Generar evaluación completa
         evaluation = self._generate_comprehensive_report()
@@ -118,70 +752,34 @@ class AIONCRBenchmarkEvaluator:
         logger.info("✅ Comprehensive evaluation completed")
         return evaluation
 
-    async def _run_general_ai_benchmarks(self):
+    async def _bounded(self, evaluation) -> BenchmarkResult:
+        """Ejecuta un evaluador respetando el límite de concurrencia"""
+        async with self._semaphore:
+            return await evaluation
+
+    async def _run_general_ai_benchmarks(self) -> List[BenchmarkResult]:
         """Ejecuta benchmarks generales de AI"""
         logger.info("📊 Running General AI Benchmarks...")
 
-        # MLPerf Inference Benchmark
-        await self._evaluate_mlperf()
-
-        # HELM (Stanford) Evaluation
-        await self._evaluate_helm()
-
-        # BIG-bench Tasks
-        await self._evaluate_big_bench()
-
-        # GLUE/SuperGLUE
-        await self._evaluate_glue_superglue()
+        return await asyncio.gather(
+            # MLPerf Inference Benchmark
+            self._bounded(self._evaluate_mlperf()),
+            # HELM (Stanford) Evaluation
+            self._bounded(self._evaluate_helm()),
+            # BIG-bench Tasks
+            self._bounded(self._evaluate_big_bench()),
+            # GLUE/SuperGLUE
+            self._bounded(self._evaluate_glue_superglue())
+        )
 
-    async def _evaluate_mlperf(self):
+    async def _evaluate_mlperf(self) -> BenchmarkResult:
         """Evalúa contra MLPerf benchmarks"""
         logger.info("🏆 Evaluating MLPerf Performance...")
 
-        start_time = time.time()
-
-        # Simular evaluación MLPerf basada en capacidades reales de AION-CR
-        mlperf_tasks = {
-            "language_modeling": {
-                "task": "Legal text completion and understanding",
-                "metric": "perplexity",
-                "aion_score": 2.1,  # Lower is better for perplexity
-                "baseline": 3.5,
-                "percentile": 92.3
-            },
-            "question_answering": {
-                "task": "Regulatory compliance Q&A",
-                "metric": "exact_match",
-                "aion_score": 0.894,
-                "baseline": 0.750,
-                "percentile": 88.7
-            },
-            "text_classification": {
-                "task": "Legal document classification",
-                "metric": "f1_score",
-                "aion_score": 0.923,
-                "baseline": 0.850,
-                "percentile": 91.2
-            },
-            "information_retrieval": {
-                "task": "Regulatory search and retrieval",
-                "metric": "ndcg@10",
-                "aion_score": 0.876,
-                "baseline": 0.720,
-                "percentile": 89.4
-            }
-        }
-
-        total_score = 0
-        task_count = len(mlperf_tasks)
-
-        for task_name, task_data in mlperf_tasks.items():
-            # Calcular puntuación normalizada
-            score = (task_data["aion_score"] / task_data["baseline"]) * 100
-            total_score += score
+        start_ns = time.perf_counter_ns()
 
-        avg_score = total_score / task_count
-        execution_time = int((time.time() - start_time) * 1000)
+        avg_score = _MLPERF_SCORE
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="MLPerf",
@@ -191,68 +789,28 @@ class AIONCRBenchmarkEvaluator:
             percentile=90.2,
             execution_time_ms=execution_time,
             details={
-                "tasks_evaluated": mlperf_tasks,
+                "tasks_evaluated": _MLPERF_TASKS,
                 "throughput_req_per_sec": self.aion_cr_capabilities["throughput_req_per_sec"],
                 "latency_p99_ms": 125,
                 "memory_efficiency": 0.847
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=avg_score >= 85.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ MLPerf completed: {avg_score:.1f}/100.0 (90.2nd percentile)")
+        logger.info("✅ MLPerf completed: %.1f/100.0 (90.2nd percentile)", avg_score)
 
-    async def _evaluate_helm(self):
+        return result
+
+    async def _evaluate_helm(self) -> BenchmarkResult:
         """Evalúa contra HELM (Holistic Evaluation of Language Models)"""
         logger.info("🎯 Evaluating HELM Capabilities...")
 
-        start_time = time.time()
-
-        helm_scenarios = {
-            "reading_comprehension": {
-                "scenario": "Legal document comprehension",
-                "accuracy": 0.912,
-                "calibration": 0.923,
-                "robustness": 0.887
-            },
-            "question_answering": {
-                "scenario": "Regulatory compliance questions",
-                "accuracy": 0.894,
-                "calibration": 0.902,
-                "robustness": 0.869
-            },
-            "summarization": {
-                "scenario": "Legal case and regulation summaries",
-                "rouge_l": 0.456,
-                "factuality": 0.891,
-                "coverage": 0.823
-            },
-            "sentiment_analysis": {
-                "scenario": "Legal opinion sentiment",
-                "accuracy": 0.867,
-                "calibration": 0.843,
-                "robustness": 0.791
-            },
-            "toxicity_detection": {
-                "scenario": "Legal content safety",
-                "accuracy": 0.943,
-                "calibration": 0.956,
-                "robustness": 0.912
-            }
-        }
-
-        # Calcular puntuación HELM agregada
-        total_score = 0
-        scenario_count = 0
+        start_ns = time.perf_counter_ns()
 
-        for scenario_name, metrics in helm_scenarios.items():
-            scenario_score = np.mean(list(metrics.values()))
-            total_score += scenario_score
-            scenario_count += 1
-
-        helm_score = (total_score / scenario_count) * 100
-        execution_time = int((time.time() - start_time) * 1000)
+        # Puntuación HELM agregada (precalculada)
+        helm_score = _HELM_SCORE
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="HELM",
@@ -262,7 +820,7 @@ class AIONCRBenchmarkEvaluator:
             percentile=87.6,
             execution_time_ms=execution_time,
             details={
-                "scenarios": helm_scenarios,
+                "scenarios": _HELM_SCENARIOS,
                 "bias_evaluation": {
                     "demographic_parity": 0.934,
                     "equalized_odds": 0.912,
@@ -273,82 +831,23 @@ class AIONCRBenchmarkEvaluator:
                     "energy_efficiency": 0.823
                 }
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=helm_score >= 80.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ HELM completed: {helm_score:.1f}/100.0 (87.6th percentile)")
+        logger.info("✅ HELM completed: %.1f/100.0 (87.6th percentile)", helm_score)
+
+        return result
 
-    async def _evaluate_big_bench(self):
+    async def _evaluate_big_bench(self) -> BenchmarkResult:
         """Evalúa contra BIG-bench tasks"""
         logger.info("🔬 Evaluating BIG-bench Tasks...")
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        # Seleccionar tareas relevantes para AION-CR
-        big_bench_tasks = {
-            "legal_support": {
-                "description": "Legal reasoning and support",
-                "score": 0.847,
-                "human_baseline": 0.720,
-                "random_baseline": 0.250
-            },
-            "logical_deduction": {
-                "description": "Multi-step logical reasoning",
-                "score": 0.823,
-                "human_baseline": 0.890,
-                "random_baseline": 0.333
-            },
-            "causal_judgement": {
-                "description": "Causal reasoning in scenarios",
-                "score": 0.756,
-                "human_baseline": 0.820,
-                "random_baseline": 0.500
-            },
-            "formal_fallacies": {
-                "description": "Detecting logical fallacies",
-                "score": 0.789,
-                "human_baseline": 0.750,
-                "random_baseline": 0.500
-            },
-            "navigate": {
-                "description": "Navigation in complex rule spaces",
-                "score": 0.912,
-                "human_baseline": 0.850,
-                "random_baseline": 0.200
-            },
-            "reasoning_about_colored_objects": {
-                "description": "Systematic reasoning",
-                "score": 0.834,
-                "human_baseline": 0.900,
-                "random_baseline": 0.100
-            },
-            "ruin_names": {
-                "description": "Understanding semantic changes",
-                "score": 0.667,
-                "human_baseline": 0.780,
-                "random_baseline": 0.500
-            },
-            "salient_translation_error_detection": {
-                "description": "Translation quality assessment",
-                "score": 0.823,
-                "human_baseline": 0.890,
-                "random_baseline": 0.500
-            }
-        }
-
-        # Calcular BIG-bench aggregate score
-        total_normalized_score = 0
-        task_count = len(big_bench_tasks)
-
-        for task_name, task_data in big_bench_tasks.items():
-            # Normalizar score relativo a human baseline
-            normalized_score = task_data["score"] / task_data["human_baseline"]
-            total_normalized_score += normalized_score
-
-        big_bench_score = (total_normalized_score / task_count) * 100
-        execution_time = int((time.time() - start_time) * 1000)
+        # BIG-bench aggregate score, normalizado respecto al human baseline
+        big_bench_score = _BIG_BENCH_RATIO * 100
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="BIG-bench",
@@ -358,114 +857,35 @@ class AIONCRBenchmarkEvaluator:
             percentile=82.4,
             execution_time_ms=execution_time,
             details={
-                "tasks_completed": len(big_bench_tasks),
+                "tasks_completed": len(_BIG_BENCH_TASKS),
                 "total_tasks_available": 204,
-                "task_results": big_bench_tasks,
-                "human_performance_ratio": total_normalized_score / task_count,
+                "task_results": _BIG_BENCH_TASKS,
+                "human_performance_ratio": _BIG_BENCH_RATIO,
                 "categories_evaluated": [
                     "logical_reasoning", "language_understanding",
                     "mathematics", "world_knowledge", "common_sense"
                 ]
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=big_bench_score >= 75.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ BIG-bench completed: {big_bench_score:.1f}/100.0 (82.4th percentile)")
+        logger.info("✅ BIG-bench completed: %.1f/100.0 (82.4th percentile)", big_bench_score)
+
+        return result
 
-    async def _evaluate_glue_superglue(self):
+    async def _evaluate_glue_superglue(self) -> BenchmarkResult:
         """Evalúa contra GLUE y SuperGLUE benchmarks"""
         logger.info("📝 Evaluating GLUE/SuperGLUE Natural Language Understanding...")
 
-        start_time = time.time()
-
-        # GLUE tasks adaptadas para dominio legal
-        glue_tasks = {
-            "cola": {  # Corpus of Linguistic Acceptability
-                "task": "Legal text grammatical acceptability",
-                "metric": "matthews_corr",
-                "score": 0.847,
-                "human_baseline": 0.690
-            },
-            "sst2": {  # Stanford Sentiment Treebank
-                "task": "Legal document sentiment",
-                "metric": "accuracy",
-                "score": 0.923,
-                "human_baseline": 0.970
-            },
-            "mrpc": {  # Microsoft Research Paraphrase Corpus
-                "task": "Legal text paraphrase detection",
-                "metric": "f1",
-                "score": 0.889,
-                "human_baseline": 0.860
-            },
-            "qqp": {  # Quora Question Pairs
-                "task": "Legal question similarity",
-                "metric": "f1",
-                "score": 0.901,
-                "human_baseline": 0.800
-            },
-            "mnli": {  # Multi-Genre Natural Language Inference
-                "task": "Legal text entailment",
-                "metric": "accuracy",
-                "score": 0.834,
-                "human_baseline": 0.920
-            },
-            "qnli": {  # Question Natural Language Inference
-                "task": "Legal Q&A inference",
-                "metric": "accuracy",
-                "score": 0.887,
-                "human_baseline": 0.910
-            },
-            "rte": {  # Recognizing Textual Entailment
-                "task": "Legal textual entailment",
-                "metric": "accuracy",
-                "score": 0.798,
-                "human_baseline": 0.930
-            }
-        }
+        start_ns = time.perf_counter_ns()
 
-        # SuperGLUE tasks (más desafiantes)
-        superglue_tasks = {
-            "boolq": {  # Boolean Questions
-                "task": "Legal yes/no questions",
-                "metric": "accuracy",
-                "score": 0.823,
-                "human_baseline": 0.890
-            },
-            "cb": {  # CommitmentBank
-                "task": "Legal commitment analysis",
-                "metric": "f1",
-                "score": 0.756,
-                "human_baseline": 0.950
-            },
-            "copa": {  # Choice of Plausible Alternatives
-                "task": "Legal causal reasoning",
-                "metric": "accuracy",
-                "score": 0.812,
-                "human_baseline": 0.940
-            },
-            "multirc": {  # Multi-Sentence Reading Comprehension
-                "task": "Legal multi-sentence comprehension",
-                "metric": "f1",
-                "score": 0.789,
-                "human_baseline": 0.900
-            },
-            "wic": {  # Word-in-Context
-                "task": "Legal term disambiguation",
-                "metric": "accuracy",
-                "score": 0.734,
-                "human_baseline": 0.800
-            }
-        }
-
-        # Calcular puntuaciones agregadas
-        glue_score = np.mean([task["score"] for task in glue_tasks.values()]) * 100
-        superglue_score = np.mean([task["score"] for task in superglue_tasks.values()]) * 100
+        # Puntuaciones agregadas (precalculadas)
+        glue_score = _GLUE_SCORE
+        superglue_score = _SUPERGLUE_SCORE
         combined_score = (glue_score + superglue_score) / 2
 
-        execution_time = int((time.time() - start_time) * 1000)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="GLUE/SuperGLUE",
@@ -477,72 +897,41 @@ class AIONCRBenchmarkEvaluator:
             details={
                 "glue_score": glue_score,
                 "superglue_score": superglue_score,
-                "glue_tasks": glue_tasks,
-                "superglue_tasks": superglue_tasks,
+                "glue_tasks": _GLUE_TASKS,
+                "superglue_tasks": _SUPERGLUE_TASKS,
                 "domain_adaptation": {
                     "legal_domain_accuracy": 0.867,
                     "cross_domain_transfer": 0.823,
                     "domain_robustness": 0.791
                 }
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=combined_score >= 80.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ GLUE/SuperGLUE completed: {combined_score:.1f}/100.0 (85.7th percentile)")
+        logger.info("✅ GLUE/SuperGLUE completed: %.1f/100.0 (85.7th percentile)", combined_score)
 
-    async def _run_agi_specific_benchmarks(self):
+        return result
+
+    async def _run_agi_specific_benchmarks(self) -> List[BenchmarkResult]:
         """Ejecuta benchmarks específicos de AGI"""
         logger.info("🧠 Running AGI-Specific Benchmarks...")
 
         # Ya tenemos AGI-AEF-Standard (167/255)
-        await self._evaluate_arc_reasoning()
-        await self._evaluate_constitutional_ai()
-        await self._evaluate_openai_evals()
+        return await asyncio.gather(
+            self._bounded(self._evaluate_arc_reasoning()),
+            self._bounded(self._evaluate_constitutional_ai()),
+            self._bounded(self._evaluate_openai_evals())
+        )
 
-    async def _evaluate_arc_reasoning(self):
+    async def _evaluate_arc_reasoning(self) -> BenchmarkResult:
         """Evalúa capacidades de razonamiento ARC (AI2 Reasoning Challenge)"""
         logger.info("🎯 Evaluating ARC Reasoning Capabilities...")
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        # ARC tasks adaptadas para razonamiento legal
-        arc_scenarios = {
-            "legal_analogical_reasoning": {
-                "description": "Reasoning by analogy in legal cases",
-                "questions_attempted": 342,
-                "correct_answers": 267,
-                "accuracy": 0.781,
-                "difficulty": "challenge"
-            },
-            "regulatory_pattern_recognition": {
-                "description": "Identifying patterns in regulations",
-                "questions_attempted": 298,
-                "correct_answers": 251,
-                "accuracy": 0.842,
-                "difficulty": "easy"
-            },
-            "causal_legal_reasoning": {
-                "description": "Cause-effect reasoning in legal contexts",
-                "questions_attempted": 187,
-                "correct_answers": 139,
-                "accuracy": 0.743,
-                "difficulty": "challenge"
-            },
-            "legal_common_sense": {
-                "description": "Common sense reasoning in legal scenarios",
-                "questions_attempted": 423,
-                "correct_answers": 356,
-                "accuracy": 0.841,
-                "difficulty": "easy"
-            }
-        }
-
-        # Calcular puntuación ARC general
-        total_correct = sum(s["correct_answers"] for s in arc_scenarios.values())
-        total_attempted = sum(s["questions_attempted"] for s in arc_scenarios.values())
-        arc_accuracy = total_correct / total_attempted
+        # Puntuación ARC general (precalculada)
+        arc_accuracy = _ARC_ACCURACY
         arc_score = arc_accuracy * 100
 
         # Comparar con baselines conocidos
@@ -550,7 +939,7 @@ class AIONCRBenchmarkEvaluator:
         random_baseline = 0.250  # Elección aleatoria
         gpt4_baseline = 0.630   # GPT-4 en ARC
 
-        execution_time = int((time.time() - start_time) * 1000)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="ARC",
@@ -560,7 +949,7 @@ class AIONCRBenchmarkEvaluator:
             percentile=78.9,
             execution_time_ms=execution_time,
             details={
-                "scenarios": arc_scenarios,
+                "scenarios": _ARC_SCENARIOS,
                 "overall_accuracy": arc_accuracy,
                 "vs_human_baseline": arc_accuracy / human_baseline,
                 "vs_gpt4_baseline": arc_accuracy / gpt4_baseline,
@@ -571,71 +960,26 @@ class AIONCRBenchmarkEvaluator:
                     "common_sense": 0.841
                 }
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=arc_score >= 75.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ ARC completed: {arc_score:.1f}/100.0 (78.9th percentile)")
+        logger.info("✅ ARC completed: %.1f/100.0 (78.9th percentile)", arc_score)
+
+        return result
 
-    async def _evaluate_constitutional_ai(self):
+    async def _evaluate_constitutional_ai(self) -> BenchmarkResult:
         """Evalúa alineación y seguridad según Constitutional AI"""
         logger.info("🛡️ Evaluating Constitutional AI Safety & Alignment...")
 
-        start_time = time.time()
-
-        constitutional_principles = {
-            "helpfulness": {
-                "description": "Providing useful legal assistance",
-                "evaluation_scenarios": 156,
-                "score": 0.923,
-                "weight": 0.35
-            },
-            "harmlessness": {
-                "description": "Avoiding harmful legal advice",
-                "evaluation_scenarios": 203,
-                "score": 0.967,
-                "weight": 0.35
-            },
-            "honesty": {
-                "description": "Truthful about legal uncertainty",
-                "evaluation_scenarios": 187,
-                "score": 0.891,
-                "weight": 0.30
-            }
-        }
-
-        safety_evaluations = {
-            "bias_mitigation": {
-                "demographic_bias": 0.976,
-                "jurisdictional_bias": 0.934,
-                "socioeconomic_bias": 0.912
-            },
-            "privacy_protection": {
-                "data_minimization": 0.989,
-                "purpose_limitation": 0.978,
-                "consent_handling": 0.967
-            },
-            "professional_ethics": {
-                "confidentiality": 0.995,
-                "conflict_of_interest": 0.987,
-                "competence_boundaries": 0.934
-            }
-        }
-
-        # Calcular puntuación Constitutional AI
-        constitutional_score = sum(
-            principle["score"] * principle["weight"]
-            for principle in constitutional_principles.values()
-        )
+        start_ns = time.perf_counter_ns()
 
-        safety_score = np.mean([
-            np.mean(list(category.values()))
-            for category in safety_evaluations.values()
-        ])
+        # Puntuación Constitutional AI (precalculada)
+        constitutional_score = _CONSTITUTIONAL_SCORE
+        safety_score = _CONSTITUTIONAL_SAFETY_SCORE
 
-        overall_score = (constitutional_score + safety_score) / 2 * 100
-        execution_time = int((time.time() - start_time) * 1000)
+        overall_score = _CONSTITUTIONAL_AI_SCORE
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="Constitutional AI",
@@ -645,9 +989,9 @@ class AIONCRBenchmarkEvaluator:
             percentile=94.2,
             execution_time_ms=execution_time,
             details={
-                "constitutional_principles": constitutional_principles,
+                "constitutional_principles": _CONSTITUTIONAL_PRINCIPLES,
                 "constitutional_score": constitutional_score,
-                "safety_evaluations": safety_evaluations,
+                "safety_evaluations": _SAFETY_EVALUATIONS,
                 "safety_score": safety_score,
                 "red_team_resistance": {
                     "adversarial_prompts_blocked": 0.987,
@@ -655,58 +999,25 @@ class AIONCRBenchmarkEvaluator:
                     "ethical_guardrails_maintained": 0.998
                 }
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=overall_score >= 90.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ Constitutional AI completed: {overall_score:.1f}/100.0 (94.2nd percentile)")
+        logger.info("✅ Constitutional AI completed: %.1f/100.0 (94.2nd percentile)", overall_score)
+
+        return result
 
-    async def _evaluate_openai_evals(self):
+    async def _evaluate_openai_evals(self) -> BenchmarkResult:
         """Evalúa usando OpenAI Evals repository"""
         logger.info("🔧 Evaluating OpenAI Evals Repository...")
 
-        start_time = time.time()
-
-        # Evaluaciones seleccionadas del repositorio OpenAI Evals
-        openai_evals = {
-            "truthfulqa": {
-                "description": "Truthfulness in Q&A responses",
-                "questions": 817,
-                "truthful_answers": 712,
-                "accuracy": 0.871
-            },
-            "legal_reasoning": {
-                "description": "Legal reasoning capabilities",
-                "questions": 245,
-                "correct_answers": 207,
-                "accuracy": 0.845
-            },
-            "factuality_check": {
-                "description": "Factual accuracy verification",
-                "claims_evaluated": 1247,
-                "accurate_claims": 1156,
-                "accuracy": 0.927
-            },
-            "logical_consistency": {
-                "description": "Consistency in logical reasoning",
-                "scenarios": 398,
-                "consistent_responses": 342,
-                "accuracy": 0.859
-            },
-            "uncertainty_calibration": {
-                "description": "Confidence calibration accuracy",
-                "predictions": 1567,
-                "well_calibrated": 1432,
-                "accuracy": 0.914
-            }
-        }
+        start_ns = time.perf_counter_ns()
 
-        # Calcular puntuación agregada OpenAI Evals
-        total_accuracy = np.mean([eval_data["accuracy"] for eval_data in openai_evals.values()])
+        # Puntuación agregada OpenAI Evals (precalculada)
+        total_accuracy = _OPENAI_ACCURACY
         openai_score = total_accuracy * 100
 
-        execution_time = int((time.time() - start_time) * 1000)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="OpenAI Evals",
@@ -716,7 +1027,7 @@ class AIONCRBenchmarkEvaluator:
             percentile=86.3,
             execution_time_ms=execution_time,
             details={
-                "evaluations": openai_evals,
+                "evaluations": _OPENAI_EVALS,
                 "total_accuracy": total_accuracy,
                 "custom_evals_created": 7,
                 "domain_specific_performance": {
@@ -725,73 +1036,38 @@ class AIONCRBenchmarkEvaluator:
                     "technical_domain": 0.834
                 }
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=openai_score >= 85.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ OpenAI Evals completed: {openai_score:.1f}/100.0 (86.3rd percentile)")
+        logger.info("✅ OpenAI Evals completed: %.1f/100.0 (86.3rd percentile)", openai_score)
 
-    async def _run_legal_specialized_benchmarks(self):
+        return result
+
+    async def _run_legal_specialized_benchmarks(self) -> List[BenchmarkResult]:
         """Ejecuta benchmarks especializados en legal"""
         logger.info("⚖️ Running Legal Specialized Benchmarks...")
 
-        await self._evaluate_legalbench()
-        await self._evaluate_cuad()
-        await self._evaluate_casehold()
+        return await asyncio.gather(
+            self._bounded(self._evaluate_legalbench()),
+            self._bounded(self._evaluate_cuad()),
+            self._bounded(self._evaluate_casehold())
+        )
 
-    async def _evaluate_legalbench(self):
+    async def _evaluate_legalbench(self) -> BenchmarkResult:
         """Evalúa contra LegalBench (162 tareas de razonamiento legal)"""
         logger.info("📚 Evaluating LegalBench Legal Reasoning Tasks...")
 
-        start_time = time.time()
-
-        # Categorías principales de LegalBench
-        legalbench_categories = {
-            "rule_application": {
-                "tasks": 23,
-                "completed": 21,
-                "avg_accuracy": 0.847,
-                "examples": ["statutory_interpretation", "contract_terms", "tort_liability"]
-            },
-            "rule_conclusion": {
-                "tasks": 31,
-                "completed": 28,
-                "avg_accuracy": 0.823,
-                "examples": ["case_outcomes", "legal_holdings", "precedent_application"]
-            },
-            "rule_interpretation": {
-                "tasks": 28,
-                "completed": 25,
-                "avg_accuracy": 0.791,
-                "examples": ["constitutional_interpretation", "regulatory_meaning", "legislative_intent"]
-            },
-            "factual_analysis": {
-                "tasks": 34,
-                "completed": 31,
-                "avg_accuracy": 0.869,
-                "examples": ["evidence_evaluation", "witness_credibility", "fact_patterns"]
-            },
-            "legal_reasoning": {
-                "tasks": 46,
-                "completed": 42,
-                "avg_accuracy": 0.812,
-                "examples": ["analogical_reasoning", "causal_analysis", "policy_implications"]
-            }
-        }
+        start_ns = time.perf_counter_ns()
 
-        # Calcular métricas agregadas
-        total_tasks = sum(cat["tasks"] for cat in legalbench_categories.values())
-        completed_tasks = sum(cat["completed"] for cat in legalbench_categories.values())
-        weighted_accuracy = sum(
-            cat["avg_accuracy"] * cat["completed"]
-            for cat in legalbench_categories.values()
-        ) / completed_tasks
+        # Métricas agregadas (precalculadas)
+        completed_tasks = _LEGALBENCH_COMPLETED
+        weighted_accuracy = _LEGALBENCH_ACCURACY
 
-        completion_rate = completed_tasks / total_tasks
+        completion_rate = completed_tasks / _LEGALBENCH_TOTAL_TASKS
         legalbench_score = weighted_accuracy * 100
 
-        execution_time = int((time.time() - start_time) * 1000)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="LegalBench",
@@ -801,7 +1077,7 @@ class AIONCRBenchmarkEvaluator:
             percentile=91.7,
             execution_time_ms=execution_time,
             details={
-                "categories": legalbench_categories,
+                "categories": _LEGALBENCH_CATEGORIES,
                 "total_tasks_available": 162,
                 "tasks_completed": completed_tasks,
                 "completion_rate": completion_rate,
@@ -814,74 +1090,28 @@ class AIONCRBenchmarkEvaluator:
                     "administrative_law": 0.856
                 }
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=legalbench_score >= 80.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ LegalBench completed: {legalbench_score:.1f}/100.0 (91.7th percentile)")
+        logger.info("✅ LegalBench completed: %.1f/100.0 (91.7th percentile)", legalbench_score)
 
-    async def _evaluate_cuad(self):
+        return result
+
+    async def _evaluate_cuad(self) -> BenchmarkResult:
         """Evalúa contra CUAD (Contract Understanding Atticus Dataset)"""
         logger.info("📋 Evaluating CUAD Contract Analysis...")
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        # Categorías de análisis de contratos CUAD
-        cuad_categories = {
-            "parties_identification": {
-                "questions": 1247,
-                "correct_answers": 1156,
-                "accuracy": 0.927,
-                "f1_score": 0.934
-            },
-            "governing_law": {
-                "questions": 897,
-                "correct_answers": 789,
-                "accuracy": 0.879,
-                "f1_score": 0.891
-            },
-            "termination_clauses": {
-                "questions": 1156,
-                "correct_answers": 982,
-                "accuracy": 0.849,
-                "f1_score": 0.867
-            },
-            "liability_limitations": {
-                "questions": 934,
-                "correct_answers": 823,
-                "accuracy": 0.881,
-                "f1_score": 0.895
-            },
-            "payment_terms": {
-                "questions": 1067,
-                "correct_answers": 945,
-                "accuracy": 0.886,
-                "f1_score": 0.902
-            },
-            "intellectual_property": {
-                "questions": 823,
-                "correct_answers": 712,
-                "accuracy": 0.865,
-                "f1_score": 0.878
-            },
-            "confidentiality": {
-                "questions": 1234,
-                "correct_answers": 1098,
-                "accuracy": 0.890,
-                "f1_score": 0.904
-            }
-        }
-
-        # Calcular métricas CUAD
-        total_questions = sum(cat["questions"] for cat in cuad_categories.values())
-        total_correct = sum(cat["correct_answers"] for cat in cuad_categories.values())
-        overall_accuracy = total_correct / total_questions
-        avg_f1_score = np.mean([cat["f1_score"] for cat in cuad_categories.values()])
+        # Métricas CUAD (precalculadas)
+        total_questions = _CUAD_TOTAL_QUESTIONS
+        overall_accuracy = _CUAD_ACCURACY
+        avg_f1_score = _CUAD_F1_SCORE
 
         cuad_score = (overall_accuracy + avg_f1_score) / 2 * 100
 
-        execution_time = int((time.time() - start_time) * 1000)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="CUAD",
@@ -891,7 +1121,7 @@ class AIONCRBenchmarkEvaluator:
             percentile=89.4,
             execution_time_ms=execution_time,
             details={
-                "categories": cuad_categories,
+                "categories": _CUAD_CATEGORIES,
                 "total_questions": total_questions,
                 "overall_accuracy": overall_accuracy,
                 "average_f1_score": avg_f1_score,
@@ -905,68 +1135,25 @@ class AIONCRBenchmarkEvaluator:
                     "risk_assessment": 0.891
                 }
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=cuad_score >= 85.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ CUAD completed: {cuad_score:.1f}/100.0 (89.4th percentile)")
+        logger.info("✅ CUAD completed: %.1f/100.0 (89.4th percentile)", cuad_score)
+
+        return result
 
-    async def _evaluate_casehold(self):
+    async def _evaluate_casehold(self) -> BenchmarkResult:
         """Evalúa contra CaseHOLD (Case Holdings on Legal Decisions)"""
         logger.info("⚖️ Evaluating CaseHOLD Legal Case Holdings...")
 
-        start_time = time.time()
-
-        # Análisis de holdings de casos legales
-        casehold_analysis = {
-            "holding_identification": {
-                "cases_analyzed": 4823,
-                "correct_holdings": 4234,
-                "accuracy": 0.878,
-                "legal_domains": ["constitutional", "contract", "tort", "criminal"]
-            },
-            "precedent_application": {
-                "precedent_cases": 2156,
-                "correctly_applied": 1876,
-                "accuracy": 0.870,
-                "citation_accuracy": 0.923
-            },
-            "legal_reasoning_chain": {
-                "reasoning_steps": 7834,
-                "valid_steps": 6912,
-                "accuracy": 0.882,
-                "logical_consistency": 0.891
-            },
-            "outcome_prediction": {
-                "case_predictions": 1967,
-                "correct_predictions": 1698,
-                "accuracy": 0.863,
-                "confidence_calibration": 0.847
-            }
-        }
-
-        # Análisis por jurisdicción
-        jurisdictional_performance = {
-            "federal_cases": {
-                "accuracy": 0.891,
-                "cases": 1823
-            },
-            "state_cases": {
-                "accuracy": 0.867,
-                "cases": 2134
-            },
-            "appellate_cases": {
-                "accuracy": 0.856,
-                "cases": 866
-            }
-        }
+        start_ns = time.perf_counter_ns()
 
-        # Calcular puntuación CaseHOLD
-        overall_accuracy = np.mean([analysis["accuracy"] for analysis in casehold_analysis.values()])
+        # Puntuación CaseHOLD (precalculada)
+        overall_accuracy = _CASEHOLD_ACCURACY
         casehold_score = overall_accuracy * 100
 
-        execution_time = int((time.time() - start_time) * 1000)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="CaseHOLD",
@@ -976,8 +1163,8 @@ class AIONCRBenchmarkEvaluator:
             percentile=87.8,
             execution_time_ms=execution_time,
             details={
-                "analysis_categories": casehold_analysis,
-                "jurisdictional_performance": jurisdictional_performance,
+                "analysis_categories": _CASEHOLD_ANALYSIS,
+                "jurisdictional_performance": _JURISDICTIONAL_PERFORMANCE,
                 "overall_accuracy": overall_accuracy,
                 "total_cases_processed": 53000,
                 "case_complexity_handling": {
@@ -992,59 +1179,27 @@ class AIONCRBenchmarkEvaluator:
                     "policy_reasoning": 0.823
                 }
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=casehold_score >= 85.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ CaseHOLD completed: {casehold_score:.1f}/100.0 (87.8th percentile)")
+        logger.info("✅ CaseHOLD completed: %.1f/100.0 (87.8th percentile)", casehold_score)
+
+        return result
 
-    async def _run_performance_benchmarks(self):
+    async def _run_performance_benchmarks(self) -> List[BenchmarkResult]:
         """Ejecuta benchmarks de rendimiento"""
         logger.info("⚡ Running Performance Benchmarks...")
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        performance_metrics = {
-            "latency": {
-                "atomic_queries_ms": 78,
-                "complex_analysis_ms": 1834,
-                "real_time_alerts_ms": 156,
-                "target_atomic_ms": 100,
-                "target_complex_ms": 2000,
-                "target_alerts_ms": 200
-            },
-            "throughput": {
-                "requests_per_second": 12847,
-                "concurrent_users": 1456,
-                "target_rps": 10000,
-                "target_users": 1000
-            },
-            "resource_efficiency": {
-                "memory_usage_mb": 387,
-                "cpu_utilization_percent": 58.3,
-                "target_memory_mb": 512,
-                "target_cpu_percent": 70.0
-            },
-            "scalability": {
-                "max_tested_load": 15000,
-                "degradation_threshold": 12000,
-                "auto_scaling_efficiency": 0.923
-            }
-        }
-
-        # Calcular puntuación de rendimiento
-        latency_score = min(100, (performance_metrics["latency"]["target_atomic_ms"] /
-                                performance_metrics["latency"]["atomic_queries_ms"]) * 100)
-
-        throughput_score = min(100, (performance_metrics["throughput"]["requests_per_second"] /
-                                   performance_metrics["throughput"]["target_rps"]) * 100)
-
-        efficiency_score = min(100, (performance_metrics["resource_efficiency"]["target_memory_mb"] /
-                                   performance_metrics["resource_efficiency"]["memory_usage_mb"]) * 100)
+        # Puntuación de rendimiento (precalculada)
+        latency_score = _LATENCY_SCORE
+        throughput_score = _THROUGHPUT_SCORE
+        efficiency_score = _EFFICIENCY_SCORE
 
         performance_score = (latency_score + throughput_score + efficiency_score) / 3
-        execution_time = int((time.time() - start_time) * 1000)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="Performance",
@@ -1054,7 +1209,7 @@ class AIONCRBenchmarkEvaluator:
             percentile=95.2,
             execution_time_ms=execution_time,
             details={
-                "performance_metrics": performance_metrics,
+                "performance_metrics": _PERFORMANCE_METRICS,
                 "latency_score": latency_score,
                 "throughput_score": throughput_score,
                 "efficiency_score": efficiency_score,
@@ -1064,54 +1219,24 @@ class AIONCRBenchmarkEvaluator:
                     "degradation_point": "18,000 req/s"
                 }
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=performance_score >= 90.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ Performance completed: {performance_score:.1f}/100.0 (95.2nd percentile)")
+        logger.info("✅ Performance completed: %.1f/100.0 (95.2nd percentile)", performance_score)
 
-    async def _run_safety_benchmarks(self):
+        return [result]
+
+    async def _run_safety_benchmarks(self) -> List[BenchmarkResult]:
         """Ejecuta benchmarks de seguridad"""
         logger.info("🛡️ Running Safety Benchmarks...")
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        safety_metrics = {
-            "bias_evaluation": {
-                "demographic_bias_score": 0.976,
-                "gender_bias_score": 0.981,
-                "racial_bias_score": 0.967,
-                "age_bias_score": 0.973,
-                "socioeconomic_bias_score": 0.912
-            },
-            "privacy_protection": {
-                "data_minimization": 0.989,
-                "purpose_limitation": 0.978,
-                "consent_mechanisms": 0.967,
-                "anonymization_quality": 0.945
-            },
-            "robustness": {
-                "adversarial_resistance": 0.934,
-                "input_validation": 0.987,
-                "error_handling": 0.923,
-                "graceful_degradation": 0.956
-            },
-            "alignment": {
-                "value_alignment": 0.987,
-                "ethical_consistency": 0.972,
-                "professional_standards": 0.995,
-                "harm_prevention": 0.999
-            }
-        }
-
-        # Calcular puntuación de seguridad
-        safety_score = np.mean([
-            np.mean(list(category.values()))
-            for category in safety_metrics.values()
-        ]) * 100
+        # Puntuación de seguridad (precalculada)
+        safety_score = _SAFETY_SCORE
 
-        execution_time = int((time.time() - start_time) * 1000)
+        execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         result = BenchmarkResult(
             benchmark_name="Safety",
@@ -1121,7 +1246,7 @@ class AIONCRBenchmarkEvaluator:
             percentile=96.7,
             execution_time_ms=execution_time,
             details={
-                "safety_metrics": safety_metrics,
+                "safety_metrics": _SAFETY_METRICS,
                 "red_team_testing": {
                     "attack_vectors_tested": 247,
                     "successful_attacks": 3,
@@ -1134,44 +1259,57 @@ class AIONCRBenchmarkEvaluator:
                     "hipaa": True
                 }
             },
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=self.run_timestamp,
             passed=safety_score >= 95.0
         )
 
-        self.results.append(result)
-        logger.info(f"✅ Safety completed: {safety_score:.1f}/100.0 (96.7th percentile)")
+        logger.info("✅ Safety completed: %.1f/100.0 (96.7th percentile)", safety_score)
+
+        return [result]
 
     def _generate_comprehensive_report(self) -> ComprehensiveEvaluation:
         """Genera reporte completo de evaluación"""
 
-        # Calcular métricas agregadas
+        # Calcular métricas agregadas en una sola pasada sobre los resultados
+        by_category: Dict[BenchmarkCategory, List[float]] = {}
+        scores = []
+        percentiles = []
+        failed_benchmarks = []
+        total_execution_time = 0
+        for r in self.results:
+            by_category.setdefault(r.category, []).append(r.score)
+            scores.append(r.score)
+            percentiles.append(r.percentile)
+            total_execution_time += r.execution_time_ms
+            if not r.passed:
+                failed_benchmarks.append(r)
+
         total_benchmarks = len(self.results)
-        passed_benchmarks = sum(1 for r in self.results if r.passed)
-        overall_score = np.mean([r.score for r in self.results])
+        passed_benchmarks = total_benchmarks - len(failed_benchmarks)
+        overall_score = fmean(scores)
+        avg_percentile = fmean(percentiles)
 
         # Agrupar por categorías
         category_scores = {}
-        for category in BenchmarkCategory:
-            category_results = [r for r in self.results if r.category == category]
+        for category in _ALL_CATEGORIES:
+            category_results = by_category.get(category)
             if category_results:
-                category_scores[category.value] = np.mean([r.score for r in category_results])
+                category_scores[category.value] = fmean(category_results)
 
         # Generar recomendaciones
-        recommendations = self._generate_recommendations()
+        recommendations = self._generate_recommendations(category_scores, failed_benchmarks)
 
         # Métricas de rendimiento
-        total_execution_time = sum(r.execution_time_ms for r in self.results)
-        avg_percentile = np.mean([r.percentile for r in self.results])
-
         performance_metrics = {
             "total_execution_time_ms": total_execution_time,
             "average_percentile": avg_percentile,
             "benchmarks_passed_rate": passed_benchmarks / total_benchmarks,
-            "evaluation_efficiency": total_benchmarks / (total_execution_time / 1000)  # benchmarks per second
+            # benchmarks per second; el tiempo se acota a 1 ms para evitar dividir entre cero
+            "evaluation_efficiency": total_benchmarks / (max(total_execution_time, 1) / 1000)
         }
 
         return ComprehensiveEvaluation(
-            evaluation_date=datetime.now(timezone.utc).isoformat(),
+            evaluation_date=self.run_timestamp,
             total_benchmarks=total_benchmarks,
             passed_benchmarks=passed_benchmarks,
             overall_score=overall_score,
@@ -1181,23 +1319,19 @@ class AIONCRBenchmarkEvaluator:
             recommendations=recommendations
         )
 
-    def _generate_recommendations(self) -> List[str]:
+    def _generate_recommendations(self, category_scores: Dict[str, float],
+                                  failed_benchmarks: List[BenchmarkResult]) -> List[str]:
         """Genera recomendaciones basadas en resultados"""
         recommendations = []
 
         # Analizar resultados por categoría
-        for category in BenchmarkCategory:
-            category_results = [r for r in self.results if r.category == category]
-            if category_results:
-                avg_score = np.mean([r.score for r in category_results])
-                if avg_score < 85.0:
-                    recommendations.append(f"Improve {category.value} capabilities (current: {avg_score:.1f}/100)")
+        for category, avg_score in category_scores.items():
+            if avg_score < 85.0:
+                recommendations.append(f"Improve {category} capabilities (current: {avg_score:.1f}/100)")
 
         # Recomendaciones específicas
-        failed_benchmarks = [r for r in self.results if not r.passed]
-        if failed_benchmarks:
-            for benchmark in failed_benchmarks:
-                recommendations.append(f"Address {benchmark.benchmark_name} performance issues")
+        for benchmark in failed_benchmarks:
+            recommendations.append(f"Address {benchmark.benchmark_name} performance issues")
 
         # Recomendaciones generales
         if not recommendations:
@@ -1211,17 +1345,27 @@ class AIONCRBenchmarkEvaluator:
 
     async def _save_evaluation_results(self, evaluation: ComprehensiveEvaluation):
         """Guarda resultados de evaluación"""
-        output_dir = Path("evaluation_results")
-        output_dir.mkdir(exist_ok=True)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+
+        # Serializar en memoria (orjson recorre los dataclasses directamente)
+        if orjson is not None:
+            payload = orjson.dumps(evaluation, option=orjson.OPT_INDENT_2, default=_json_default)
+        else:
+            payload = json.dumps(evaluation, indent=2, default=_json_default).encode('utf-8')
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Escribir el JSON en un hilo para no bloquear el event loop
+        json_file = self.output_dir / f"aion_cr_comprehensive_evaluation_{timestamp}.json"
+        await asyncio.to_thread(json_file.write_bytes, payload)
 
-        # Guardar como JSON
-        json_file = output_dir / f"aion_cr_comprehensive_evaluation_{timestamp}.json"
-        with open(json_file, 'w') as f:
-            json.dump(asdict(evaluation), f, indent=2, default=str)
+        logger.info("💾 Evaluation results saved to: %s", json_file)
 
-        logger.info(f"💾 Evaluation results saved to: {json_file}")
+def _json_default(obj: Any) -> Any:
+    """Codifica dataclasses campo a campo (sin la copia de asdict) y tablas congeladas"""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    return str(obj)
 
 # Función principal de ejecución
 async def main():
@@ -1230,18 +1374,20 @@ async def main():
     evaluation = await evaluator.run_comprehensive_evaluation()
 
     # Mostrar resumen
-    print("\n" + "="*80)
-    print("🏆 AION-CR COMPREHENSIVE AI BENCHMARK EVALUATION RESULTS")
-    print("="*80)
-    print(f"📊 Overall Score: {evaluation.overall_score:.1f}/100.0")
-    print(f"✅ Benchmarks Passed: {evaluation.passed_benchmarks}/{evaluation.total_benchmarks}")
-    print(f"📈 Pass Rate: {(evaluation.passed_benchmarks/evaluation.total_benchmarks)*100:.1f}%")
-    print("\n📋 Category Scores:")
+    lines = []
+    lines.append("\n" + "="*80)
+    lines.append("🏆 AION-CR COMPREHENSIVE AI BENCHMARK EVALUATION RESULTS")
+    lines.append("="*80)
+    lines.append(f"📊 Overall Score: {evaluation.overall_score:.1f}/100.0")
+    lines.append(f"✅ Benchmarks Passed: {evaluation.passed_benchmarks}/{evaluation.total_benchmarks}")
+    lines.append(f"📈 Pass Rate: {(evaluation.passed_benchmarks/evaluation.total_benchmarks)*100:.1f}%")
+    lines.append("\n📋 Category Scores:")
     for category, score in evaluation.category_scores.items():
-        print(f"   {category.title()}: {score:.1f}/100.0")
+        lines.append(f"   {category.title()}: {score:.1f}/100.0")
 
-    print(f"\n⏱️ Total Execution Time: {evaluation.performance_metrics['total_execution_time_ms']/1000:.1f}s")
-    print("="*80)
+    lines.append(f"\n⏱️ Total Execution Time: {evaluation.performance_metrics['total_execution_time_ms']/1000:.1f}s")
+    lines.append("="*80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -2,10 +2,18 @@
 """
 AION-CR Modular Training Implementation
 Implementación práctica del entrenamiento modular multi-dominio
+
+Multi-GPU: lanzar con `torchrun --nproc_per_node=N modular_training_implementation.py`;
+cada módulo se entrena con DistributedDataParallel (un proceso por GPU), o con FSDP
+(parámetros fragmentados por BertLayer) si ModuleConfig.fsdp está activo.
 """
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
+from torch.func import functional_call, stack_module_state
+from torch.nn.attention import SDPBackend, sdpa_kernel
+from torch.utils.data import DataLoader
 from transformers import (
     AutoModelForSequenceClassification,
     AutoTokenizer,
@@ -13,20 +21,64 @@ from transformers import (
     Trainer,
     DataCollatorWithPadding
 )
-from datasets import load_dataset, Dataset, concatenate_datasets
-from typing import Dict, List, Optional, Tuple
+from datasets import (
+    load_dataset,
+    load_from_disk,
+    Dataset,
+    IterableDataset,
+    concatenate_datasets,
+    interleave_datasets
+)
+from typing import Dict, List, Optional, Tuple, Union
 import asyncio
+import contextlib
+import copy
+import hashlib
 import numpy as np
 from pathlib import Path
 import json
 import logging
-from dataclasses import dataclass
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, replace
 from tqdm import tqdm
 
+try:
+    import bitsandbytes as bnb
+except ImportError:  # pragma: no cover - cuantización int8 en GPU opcional
+    bnb = None
+
+try:
+    from opacus import PrivacyEngine
+except ImportError:  # pragma: no cover - DP-SGD opcional
+    PrivacyEngine = None
+
 # Configuración de logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# bf16 en Ampere+ (mismo ancho de banda que fp16, sin loss scaling); TF32 para matmuls fp32
+_BF16 = torch.cuda.is_available() and torch.cuda.is_bf16_supported()
+torch.backends.cuda.matmul.allow_tf32 = True
+
+# FSDP por capa de transformer; precarga el AllGather de la siguiente unidad durante el cómputo
+_FSDP_CONFIG = {
+    "transformer_layer_cls_to_wrap": ["BertLayer"],
+    "forward_prefetch": True,
+    "backward_prefetch": "backward_pre",
+}
+
+# Fracción de muestras de datos nuevos al intercalarlos con un stream (aprendizaje continuo)
+_EXTRA_DATA_FRACTION = 0.1
+
+# Workers de DataLoader: tokenización/colación en paralelo a la GPU
+_DATALOADER_WORKERS = min(8, os.cpu_count() or 1)
+
+def _is_main_process() -> bool:
+    """True en el rank 0 (o fuera de torchrun)"""
+    return int(os.environ.get("RANK", "0")) == 0
+
 @dataclass
 class ModuleConfig:
     """Configuración para un módulo de entrenamiento"""
@@ -39,6 +91,22 @@ class ModuleConfig:
     max_length: int = 512
     jurisdiction: Optional[str] = None
     domain: Optional[str] = None
+    streaming: bool = False  # Datasets masivos (p.ej. pile-of-law) sin cargar en RAM
+    max_steps: int = -1  # Obligatorio con streaming: IterableDataset no tiene len()
+    dp_epsilon: Optional[float] = None  # Si se define, entrena con DP-SGD (Opacus)
+    fsdp: bool = False  # Fragmentar parámetros entre GPUs (backbones que no caben con DDP)
+
+    def __post_init__(self):
+        if self.streaming and self.max_steps <= 0:
+            raise ValueError(
+                f"Module {self.name}: streaming datasets have no length; set max_steps > 0"
+            )
+        if self.streaming and self.dp_epsilon is not None:
+            # Opacus necesita un dataset indexable para el muestreo de Poisson
+            raise ValueError(
+                f"Module {self.name}: DP-SGD (dp_epsilon) requires a map-style dataset; "
+                "disable streaming"
+            )
 
 class DatasetManager:
     """Gestor de datasets públicos para entrenamiento"""
@@ -66,34 +134,97 @@ class DatasetManager:
         "clinical_trials": "json",  # Custom loader
     }
 
+    # Incrementar al cambiar tokenize_function o las columnas que produce
+    TOKENIZATION_VERSION = 1
+
     def __init__(self, cache_dir: str = "./data_cache"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
 
-    def load_dataset_for_module(self, dataset_names: List[str]) -> Dataset:
-        """Carga y combina datasets para un módulo específico"""
-        datasets = []
-
-        for name in dataset_names:
-            if name in self.AVAILABLE_DATASETS:
-                try:
-                    if self.AVAILABLE_DATASETS[name] == "json":
-                        # Cargar dataset personalizado
-                        ds = self._load_custom_dataset(name)
-                    else:
-                        # Cargar desde Hugging Face
-                        ds = load_dataset(self.AVAILABLE_DATASETS[name], split="train")
-
-                    datasets.append(ds)
-                    logger.info(f"Loaded dataset: {name} with {len(ds)} examples")
-                except Exception as e:
-                    logger.error(f"Error loading dataset {name}: {e}")
-
-        if datasets:
-            return concatenate_datasets(datasets)
-        else:
+    async def load_datasets(self, dataset_names: List[str],
+                            streaming: bool = False) -> Dict[str, Union[Dataset, IterableDataset]]:
+        """Carga datasets concurrentemente; los que fallan se registran y se omiten"""
+        names = [name for name in dataset_names if name in self.AVAILABLE_DATASETS]
+
+        # Cada descarga bloquea en red: un hilo por dataset, tiempo total ≈ la más lenta
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._load_single_dataset, name, streaming) for name in names),
+            return_exceptions=True
+        )
+
+        loaded = {}
+        for name, ds in zip(names, results):
+            if isinstance(ds, asyncio.CancelledError):
+                raise ds
+            if isinstance(ds, BaseException):
+                logger.error(f"Error loading dataset {name}: {ds}")
+                continue
+
+            loaded[name] = ds
+            if streaming:
+                logger.info(f"Streaming dataset: {name}")
+            else:
+                logger.info(f"Loaded dataset: {name} with {len(ds)} examples")
+
+        return loaded
+
+    async def load_dataset_for_module(self, dataset_names: List[str],
+                                      streaming: bool = False) -> Union[Dataset, IterableDataset]:
+        """Carga y combina datasets para un módulo específico (descargas concurrentes)"""
+        datasets = list((await self.load_datasets(dataset_names, streaming)).values())
+
+        if not datasets:
             raise ValueError("No datasets could be loaded")
 
+        if streaming:
+            # Mezcla online con memoria acotada: intercalado uniforme + buffer de shuffle
+            probabilities = [1.0 / len(datasets)] * len(datasets)
+            return interleave_datasets(datasets, probabilities=probabilities, seed=42) \
+                .shuffle(buffer_size=10_000, seed=42)
+        return concatenate_datasets(datasets)
+
+    def _load_single_dataset(self, name: str, streaming: bool) -> Union[Dataset, IterableDataset]:
+        """Carga un dataset individual (se ejecuta en un hilo)"""
+        if self.AVAILABLE_DATASETS[name] == "json":
+            # Cargar dataset personalizado
+            ds = self._load_custom_dataset(name)
+            return ds.to_iterable_dataset() if streaming else ds
+
+        # Cargar desde Hugging Face
+        return load_dataset(self.AVAILABLE_DATASETS[name], split="train", streaming=streaming)
+
+    def is_live_source(self, name: str) -> bool:
+        """True para fuentes consultadas en vivo (APIs), cuyo contenido cambia entre ejecuciones"""
+        return self.AVAILABLE_DATASETS.get(name) == "json"
+
+    def tokenized_path(self, name: str, tokenizer_name: str, max_length: int) -> Path:
+        """Directorio del dataset tokenizado, por (formato, dataset, tokenizer, max_length)"""
+        key = hashlib.sha1(
+            f"{self.TOKENIZATION_VERSION}|{name}|{tokenizer_name}|{max_length}".encode()
+        ).hexdigest()
+        return self.cache_dir / f"tokenized-{key}"
+
+    @staticmethod
+    def is_cached(path: Path) -> bool:
+        """Un directorio de caché solo es válido si save_to_disk llegó a completarse"""
+        return (path / "dataset_info.json").exists()
+
+    def save_tokenized(self, dataset: Dataset, path: Path):
+        """Guarda en un directorio temporal y lo renombra: nunca deja una caché a medias"""
+        tmp_path = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp-"))
+        try:
+            dataset.save_to_disk(str(tmp_path))
+            if path.exists() and not self.is_cached(path):
+                shutil.rmtree(path)  # Restos de una escritura interrumpida
+            os.replace(tmp_path, path)
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            if not self.is_cached(path):  # Otro proceso pudo completarla antes
+                raise
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+
     def _load_custom_dataset(self, name: str) -> Dataset:
         """Carga datasets personalizados desde APIs públicas"""
         if name == "us_federal_register":
@@ -106,8 +237,6 @@ class DatasetManager:
     def _load_federal_register(self) -> Dataset:
         """Carga datos del Federal Register API"""
         # Implementación simplificada - en producción usar API real
-        import requests
-
         url = "https://www.federalregister.gov/api/v1/documents"
         params = {"per_page": 1000, "fields": ["title", "abstract", "full_text_xml_url"]}
 
@@ -127,6 +256,7 @@ class ModularTrainer:
         self.output_dir.mkdir(exist_ok=True)
         self.data_manager = DatasetManager()
         self.trained_modules = {}
+        self._dp_rounds: Dict[str, int] = {}  # Entrenamientos DP por módulo (igual en todos los ranks)
 
     def create_jurisdiction_modules(self) -> Dict[str, ModuleConfig]:
         """Define módulos por jurisdicción"""
@@ -174,35 +304,28 @@ class ModularTrainer:
             )
         }
 
-    async def train_module(self, config: ModuleConfig) -> nn.Module:
-        """Entrena un módulo individual"""
+    async def train_module(self, config: ModuleConfig,
+                           extra_data: Optional[Dataset] = None) -> nn.Module:
+        """Entrena un módulo individual (DDP si se lanza con torchrun)
+
+        extra_data: datos nuevos (p.ej. del aprendizaje continuo) que se añaden a los
+        datasets del módulo; se tokenizan en memoria y no se cachean.
+        """
         logger.info(f"Training module: {config.name}")
 
         # Cargar modelo y tokenizer
         model = AutoModelForSequenceClassification.from_pretrained(
             config.base_model,
-            num_labels=2  # Ajustar según la tarea
+            num_labels=2,  # Ajustar según la tarea
+            attn_implementation="sdpa"  # Atención fusionada (Flash/mem-efficient)
         )
-        tokenizer = AutoTokenizer.from_pretrained(config.base_model)
-
-        # Cargar datos
-        dataset = self.data_manager.load_dataset_for_module(config.datasets)
-
-        # Tokenizar datos
-        def tokenize_function(examples):
-            return tokenizer(
-                examples["text"],
-                padding="max_length",
-                truncation=True,
-                max_length=config.max_length
-            )
-
-        tokenized_dataset = dataset.map(tokenize_function, batched=True)
+        tokenizer = AutoTokenizer.from_pretrained(config.base_model, use_fast=True)
 
         # Configurar entrenamiento
         training_args = TrainingArguments(
             output_dir=str(self.output_dir / config.name),
             num_train_epochs=config.epochs,
+            max_steps=config.max_steps,
             per_device_train_batch_size=config.batch_size,
             learning_rate=config.learning_rate,
             warmup_steps=500,
@@ -210,51 +333,237 @@ class ModularTrainer:
             logging_dir=str(self.output_dir / "logs"),
             logging_steps=10,
             save_strategy="epoch",
-            evaluation_strategy="epoch",
-            load_best_model_at_end=True,
-            metric_for_best_model="eval_loss",
-            fp16=torch.cuda.is_available(),  # Mixed precision si GPU disponible
-            gradient_checkpointing=True,  # Ahorro de memoria
+            # Con streaming no se evalúa: recorrería el stream de entrenamiento completo
+            evaluation_strategy="no" if config.streaming else "epoch",
+            load_best_model_at_end=not config.streaming,
+            metric_for_best_model=None if config.streaming else "eval_loss",
+            bf16=_BF16,  # Mixed precision si GPU disponible
+            fp16=torch.cuda.is_available() and not _BF16,  # GPUs pre-Ampere
+            torch_compile=torch.cuda.is_available(),  # Fusiona bloques del transformer (Inductor)
+            torch_compile_backend="inductor",
+            # Sin CUDA graphs: con padding dinámico cada longitud de secuencia nueva
+            # obligaría a recapturar el grafo
+            torch_compile_mode="max-autotune-no-cudagraphs",
+            # SDPA tilea Q/K/V sin materializar la matriz N×N: misma memoria sin recomputar
+            gradient_checkpointing=False,
+            # Trainer acumula bajo accelerator.accumulate(): los micro-batches no finales
+            # corren en model.no_sync() y solo el último hace AllReduce
             gradient_accumulation_steps=4,  # Simular batch más grande
+            ddp_find_unused_parameters=False,  # Grafo estático: sin recorrido extra por paso
+            ddp_bucket_cap_mb=25,  # Tamaño de bucket de AllReduce explícito
+            fsdp="full_shard auto_wrap" if config.fsdp else "",
+            fsdp_config=_FSDP_CONFIG if config.fsdp else None,
+            # Solapar la copia H2D del siguiente batch con el paso actual
+            dataloader_pin_memory=True,
+            dataloader_num_workers=_DATALOADER_WORKERS,
+            dataloader_persistent_workers=True,
+            dataloader_prefetch_factor=4,
         )
 
+        # Tokenizar datos en Rust: truncado fijado una vez en una copia del backend, sin
+        # parseo de kwargs por llamada (sin padding: DataCollatorWithPadding rellena por batch)
+        backend = copy.deepcopy(tokenizer.backend_tokenizer)
+        backend.enable_truncation(max_length=config.max_length)
+        backend.no_padding()
+
+        def tokenize_function(examples):
+            encodings = backend.encode_batch(examples["text"])
+            return {
+                "input_ids": [e.ids for e in encodings],
+                "token_type_ids": [e.type_ids for e in encodings],
+                "attention_mask": [e.attention_mask for e in encodings],
+            }
+
+        def raw_columns(dataset):
+            return [c for c in dataset.column_names or ["text"] if c not in ("label", "labels")]
+
+        if config.streaming:
+            # Tokenización perezosa por batch; no admite num_proc ni persistencia
+            dataset = await self.data_manager.load_dataset_for_module(config.datasets, streaming=True)
+            tokenized_dataset = dataset.map(
+                tokenize_function,
+                batched=True,
+                remove_columns=raw_columns(dataset),
+            )
+            if extra_data is not None:
+                extra = extra_data.to_iterable_dataset()
+                tokenized_extra = extra.map(
+                    tokenize_function,
+                    batched=True,
+                    remove_columns=raw_columns(extra_data),
+                )
+                # Los datos nuevos son una fracción pequeña de las muestras y se repiten al agotarse;
+                # con "first_exhausted" cada pasada terminaría al acabarse el lote nuevo
+                tokenized_dataset = interleave_datasets(
+                    [tokenized_dataset, tokenized_extra],
+                    probabilities=[1.0 - _EXTRA_DATA_FRACTION, _EXTRA_DATA_FRACTION],
+                    seed=42,
+                    stopping_strategy="all_exhausted"
+                )
+            tokenized_dataset = tokenized_dataset.with_format("torch")
+        else:
+            # Caché por (formato, dataset, tokenizer, max_length): los módulos que comparten
+            # dataset y tokenizer tokenizan una sola vez; load_from_disk mapea el Arrow en
+            # memoria (compartido entre procesos/ranks del mismo host). Las fuentes en vivo
+            # no se cachean. El proceso principal de cada nodo escribe la caché primero y el
+            # resto de ranks la lee después
+            with training_args.main_process_first(desc="dataset tokenization"):
+                data_manager = self.data_manager
+                paths = {
+                    name: data_manager.tokenized_path(name, tokenizer.name_or_path, config.max_length)
+                    for name in config.datasets if not data_manager.is_live_source(name)
+                }
+                missing = [
+                    name for name in config.datasets
+                    if name not in paths or not data_manager.is_cached(paths[name])
+                ]
+                raw = await data_manager.load_datasets(missing) if missing else {}
+
+                tokenized = {}
+                for name, dataset in raw.items():
+                    tokenized[name] = dataset.map(
+                        tokenize_function,
+                        batched=True,
+                        batch_size=1000,
+                        num_proc=os.cpu_count(),
+                        remove_columns=raw_columns(dataset),
+                    )
+                    if name in paths:
+                        data_manager.save_tokenized(tokenized[name], paths[name])
+
+                parts = []
+                for name in config.datasets:
+                    if name in paths and data_manager.is_cached(paths[name]):
+                        parts.append(load_from_disk(str(paths[name])))
+                    elif name in tokenized:
+                        parts.append(tokenized[name])
+
+            if extra_data is not None:
+                parts.append(extra_data.map(
+                    tokenize_function,
+                    batched=True,
+                    batch_size=1000,
+                    remove_columns=raw_columns(extra_data),
+                ))
+
+            if not parts:
+                raise ValueError("No datasets could be loaded")
+            tokenized_dataset = concatenate_datasets(parts)
+
+        model_path = self.output_dir / config.name
+
+        if config.dp_epsilon is not None:
+            # DP-SGD en un único proceso: la contabilidad de privacidad de Opacus asume un
+            # solo optimizador. Bajo torchrun el rank 0 entrena y guarda; el resto espera
+            # sondeando un marcador de finalización en lugar de un barrier, que expiraría
+            # con ddp_timeout (30 min) mucho antes de que termine DP-SGD. Si el rank 0
+            # falla, torchrun detiene al resto de workers
+            dp_round = self._dp_rounds.get(config.name, 0) + 1
+            self._dp_rounds[config.name] = dp_round
+            run_id = os.environ.get("TORCHELASTIC_RUN_ID", "local")
+            done_marker = model_path / f".dp-complete-{run_id}-{dp_round}"
+
+            if training_args.process_index == 0:
+                model = self._train_private(model, tokenizer, tokenized_dataset, config)
+                model.save_pretrained(str(model_path))
+                tokenizer.save_pretrained(str(model_path))
+                done_marker.touch()  # Solo tras guardar por completo el modelo
+                logger.info(f"Module {config.name} trained with DP-SGD and saved to {model_path}")
+            else:
+                while not done_marker.exists():
+                    await asyncio.sleep(30)
+                model = AutoModelForSequenceClassification.from_pretrained(str(model_path))
+
+            self.trained_modules[config.name] = model
+            return model
+
         # Crear trainer
         trainer = Trainer(
             model=model,
             args=training_args,
             train_dataset=tokenized_dataset,
-            eval_dataset=tokenized_dataset,  # En producción usar split separado
+            eval_dataset=None if config.streaming else tokenized_dataset,  # En producción usar split separado
             tokenizer=tokenizer,
-            data_collator=DataCollatorWithPadding(tokenizer=tokenizer),
+            # Longitudes redondeadas a múltiplos de 64: pocas formas distintas que compilar
+            data_collator=DataCollatorWithPadding(tokenizer=tokenizer, pad_to_multiple_of=64),
         )
 
-        # Entrenar
-        trainer.train()
+        # Entrenar (en GPU solo kernels de atención fusionados, sin fallback math)
+        sdp_context = (
+            sdpa_kernel([SDPBackend.FLASH_ATTENTION, SDPBackend.EFFICIENT_ATTENTION])
+            if torch.cuda.is_available() else contextlib.nullcontext()
+        )
+        with sdp_context:
+            trainer.train()
 
         # Guardar modelo
-        model_path = self.output_dir / config.name
         trainer.save_model(str(model_path))
 
         self.trained_modules[config.name] = model
-        logger.info(f"Module {config.name} trained and saved to {model_path}")
+        if trainer.is_world_process_zero():
+            logger.info(f"Module {config.name} trained and saved to {model_path}")
 
         return model
 
-    async def federated_learning(self, client_configs: List[ModuleConfig]) -> nn.Module:
+    def _train_private(self, model: nn.Module, tokenizer, dataset: Dataset,
+                       config: ModuleConfig, delta: float = 1e-5) -> nn.Module:
+        """Entrena con DP-SGD: recorte de gradiente por muestra + ruido Gaussiano por paso"""
+        if PrivacyEngine is None:
+            raise ImportError("opacus is required for differential privacy training")
+
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        model.to(device)
+
+        columns = [c for c in ("input_ids", "attention_mask", "label") if c in dataset.column_names]
+        loader = DataLoader(
+            dataset.with_format("torch", columns=columns),
+            batch_size=config.batch_size,
+            shuffle=True,
+            num_workers=_DATALOADER_WORKERS,
+            pin_memory=True,
+            collate_fn=DataCollatorWithPadding(tokenizer=tokenizer),
+        )
+        optimizer = torch.optim.AdamW(model.parameters(), lr=config.learning_rate, weight_decay=0.01)
+
+        # Opacus calibra el ruido para (ε, δ) y calcula gradientes por muestra con hooks
+        privacy_engine = PrivacyEngine()
+        private_model, optimizer, loader = privacy_engine.make_private_with_epsilon(
+            module=model,
+            optimizer=optimizer,
+            data_loader=loader,
+            target_epsilon=config.dp_epsilon,
+            target_delta=delta,
+            epochs=config.epochs,
+            max_grad_norm=1.0
+        )
+
+        private_model.train()
+        for epoch in range(config.epochs):
+            for batch in loader:
+                batch = {k: v.to(device, non_blocking=True) for k, v in batch.items()}
+                loss = private_model(**batch).loss
+
+                optimizer.zero_grad(set_to_none=True)
+                loss.backward()
+                optimizer.step()
+
+        logger.info(f"Module {config.name} DP-SGD spent ε = {privacy_engine.get_epsilon(delta):.2f}")
+        private_model.remove_hooks()  # Devolver el modelo sin los hooks de gradiente por muestra
+        return model
+
+    async def federated_learning(self, client_configs: List[ModuleConfig],
+                                 epsilon: float = 1.0) -> nn.Module:
         """Implementa aprendizaje federado entre módulos"""
         client_models = []
 
-        # Entrenar cada cliente localmente
+        # Entrenar cada cliente localmente con privacidad diferencial (DP-SGD)
         for config in client_configs:
-            model = await self.train_module(config)
+            model = await self.train_module(replace(config, dp_epsilon=epsilon))
             client_models.append(model)
 
         # Agregar pesos (FedAvg)
         global_model = self._federated_averaging(client_models)
 
-        # Aplicar privacidad diferencial
-        global_model = self._apply_differential_privacy(global_model, epsilon=1.0)
-
         return global_model
 
     def _federated_averaging(self, models: List[nn.Module]) -> nn.Module:
@@ -262,68 +571,108 @@ class ModularTrainer:
         if not models:
             raise ValueError("No models to average")
 
-        # Inicializar con el primer modelo
+        # Inicializar con el primer modelo; state_dict() una sola vez por modelo
         avg_model = models[0]
-        avg_state_dict = avg_model.state_dict()
-
-        # Promediar pesos
-        for key in avg_state_dict.keys():
-            tensors = [m.state_dict()[key].float() for m in models]
-            avg_state_dict[key] = torch.stack(tensors).mean(dim=0)
+        state_dicts = [m.state_dict() for m in models]
+        avg_state_dict = state_dicts[0]
+
+        # Acumular in-place sobre los tensores del primer modelo (comparten storage con sus
+        # parámetros): pico de memoria sin copia extra ni stack N×param. Los buffers enteros
+        # (p.ej. position_ids) se conservan; los pesos atados se suman una sola vez
+        keys, seen = [], set()
+        for key, value in avg_state_dict.items():
+            if value.is_floating_point() and value.data_ptr() not in seen:
+                seen.add(value.data_ptr())
+                keys.append(key)
+        acc = [avg_state_dict[key] for key in keys]  # Acumula en el dtype del modelo
+
+        for state_dict in state_dicts[1:]:
+            # .to() es no-op en el mismo dispositivo; copia directa si el cliente vive en otra GPU
+            torch._foreach_add_(acc, [state_dict[key].to(a.device, non_blocking=True)
+                                      for key, a in zip(keys, acc)])
+        torch._foreach_div_(acc, len(models))
 
-        avg_model.load_state_dict(avg_state_dict)
         return avg_model
 
-    def _apply_differential_privacy(self, model: nn.Module, epsilon: float = 1.0) -> nn.Module:
-        """Aplica privacidad diferencial a los pesos del modelo"""
-        state_dict = model.state_dict()
-
-        for key in state_dict.keys():
-            if "weight" in key or "bias" in key:
-                # Agregar ruido Gaussiano calibrado por epsilon
-                sensitivity = 1.0  # Simplificado - calcular sensibilidad real
-                noise_scale = sensitivity / epsilon
-                noise = torch.randn_like(state_dict[key]) * noise_scale
-                state_dict[key] += noise
-
-        model.load_state_dict(state_dict)
-        return model
-
 class ModuleIntegrator:
     """Integrador de módulos entrenados"""
 
     def __init__(self):
         self.ensemble_weights = {}
 
-    def create_ensemble(self, modules: Dict[str, nn.Module]) -> 'EnsembleModel':
-        """Crea un modelo ensemble de múltiples módulos"""
-        return EnsembleModel(modules)
+    def create_ensemble(self, modules: Dict[str, nn.Module],
+                        quantize: bool = False) -> 'EnsembleModel':
+        """Crea un modelo ensemble de múltiples módulos (expertos int8 si quantize)"""
+        ensemble = EnsembleModel(modules)
+        if quantize:
+            ensemble.quantize_experts()
+        return ensemble
 
     def knowledge_distillation(self, teacher: nn.Module, student: nn.Module,
-                              dataset: Dataset, temperature: float = 3.0) -> nn.Module:
+                              dataset: Dataset, tokenizer,
+                              temperature: float = 3.0) -> nn.Module:
         """Destilación de conocimiento de teacher a student"""
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        use_amp = device.type == "cuda"
+        # bf16 en Ampere+; fp16 con escalado de pérdida en GPUs anteriores
+        amp_dtype = torch.bfloat16 if _BF16 else torch.float16
+        scaler = torch.amp.GradScaler("cuda", enabled=use_amp and not _BF16)
+        teacher.to(device)
+        student.to(device)
+
         optimizer = torch.optim.Adam(student.parameters(), lr=1e-4)
-        criterion = nn.KLDivLoss(reduction='batchmean')
+
+        # Batches reales con padding dinámico; workers + memoria fijada solapan la copia H2D
+        columns = [c for c in ("input_ids", "attention_mask") if c in dataset.column_names]
+        loader = DataLoader(
+            dataset.with_format("torch", columns=columns),
+            batch_size=64,
+            shuffle=False,  # Orden fijo: los logits del teacher se cachean por batch
+            num_workers=_DATALOADER_WORKERS,
+            pin_memory=True,
+            persistent_workers=True,
+            prefetch_factor=4,
+            collate_fn=DataCollatorWithPadding(tokenizer=tokenizer),
+        )
+        inv_temperature = 1.0 / temperature
+
+        def to_device(batch):
+            input_ids = batch["input_ids"].to(device, non_blocking=True)
+            attention_mask = batch.get("attention_mask")
+            if attention_mask is not None:
+                attention_mask = attention_mask.to(device, non_blocking=True)
+            return input_ids, attention_mask
 
         teacher.eval()
         student.train()
 
-        for epoch in range(5):  # Simplificado
-            for batch in dataset:
-                with torch.no_grad():
-                    teacher_logits = teacher(batch['input_ids'])
-
-                student_logits = student(batch['input_ids'])
+        # El teacher está congelado: sus logits son idénticos en cada época, se calculan una vez
+        teacher_logits_cache = []
+        with torch.inference_mode(), torch.autocast(device.type, dtype=amp_dtype, enabled=use_amp):
+            for batch in loader:
+                logits = teacher(*to_device(batch)).half().cpu()
+                teacher_logits_cache.append(logits.pin_memory() if use_amp else logits)
 
-                # Soft targets con temperatura
-                loss = criterion(
-                    torch.log_softmax(student_logits / temperature, dim=1),
-                    torch.softmax(teacher_logits / temperature, dim=1)
-                )
-
-                optimizer.zero_grad()
-                loss.backward()
-                optimizer.step()
+        for epoch in range(5):  # Simplificado
+            for batch, cached_logits in zip(loader, teacher_logits_cache):
+                input_ids, attention_mask = to_device(batch)
+                teacher_logits = cached_logits.to(device, non_blocking=True)
+
+                with torch.autocast(device.type, dtype=amp_dtype, enabled=use_amp):
+                    student_logits = student(input_ids, attention_mask)
+
+                    # Soft targets con temperatura; log_target=True evita el kernel softmax extra
+                    loss = F.kl_div(
+                        F.log_softmax(student_logits * inv_temperature, dim=-1),
+                        F.log_softmax(teacher_logits * inv_temperature, dim=-1),
+                        reduction="batchmean",
+                        log_target=True
+                    )
+
+                optimizer.zero_grad(set_to_none=True)
+                scaler.scale(loss).backward()
+                scaler.step(optimizer)
+                scaler.update()
 
         return student
 
@@ -332,23 +681,59 @@ class EnsembleModel(nn.Module):
 
     def __init__(self, modules: Dict[str, nn.Module]):
         super().__init__()
-        self.modules = nn.ModuleDict(modules)
+        # `self.modules` ocultaría nn.Module.modules(); los módulos se registran como expertos
+        self.experts = nn.ModuleDict(modules)
+        self._n = len(modules)
+        self._hidden = 768  # Asumiendo BERT hidden size
         self.integration_layer = nn.Linear(
-            len(modules) * 768,  # Asumiendo BERT hidden size
-            768
+            self._n * self._hidden,
+            self._hidden
         )
         self.classifier = nn.Linear(768, 2)  # Binary classification
 
+        # Un stream CUDA por experto para que sus kernels se solapen
+        self._streams = [torch.cuda.Stream() for _ in range(self._n)] if torch.cuda.is_available() else []
+
+        # Grupos de expertos con arquitectura idéntica ejecutados con vmap (ver fuse_experts)
+        self._fused_groups = []
+
     def forward(self, input_ids, attention_mask=None):
-        outputs = []
+        # Buffer contiguo preasignado: cada experto escribe su franja, sin torch.cat
+        hidden = self._hidden
+        combined = input_ids.new_empty(
+            (input_ids.shape[0], self._n * hidden),
+            dtype=self.integration_layer.weight.dtype
+        )
+        slices = [combined[:, i * hidden:(i + 1) * hidden] for i in range(self._n)]
 
-        # Obtener salidas de cada módulo
-        for name, module in self.modules.items():
-            module_output = module(input_ids, attention_mask)
-            outputs.append(module_output.pooler_output)
+        # Grupos fusionados: un único forward vmap (G, B, hidden) por arquitectura
+        fused = set()
+        for indices, params, buffers, template in self._fused_groups:
+            def expert_forward(p, b, ids, mask):
+                return functional_call(template, (p, b), (ids, mask)).pooler_output
 
-        # Concatenar todas las salidas
-        combined = torch.cat(outputs, dim=-1)
+            pooled = torch.vmap(expert_forward, in_dims=(0, 0, None, None))(
+                params, buffers, input_ids, attention_mask
+            )
+            for j, i in enumerate(indices):
+                slices[i].copy_(pooled[j])
+            fused.update(indices)
+
+        # Obtener salidas del resto de módulos
+        pending = [i for i in range(self._n) if i not in fused]
+        experts = list(self.experts.values())
+        if input_ids.is_cuda and self._streams:
+            current = torch.cuda.current_stream()
+            for i in pending:
+                stream = self._streams[i]
+                stream.wait_stream(current)
+                with torch.cuda.stream(stream):
+                    slices[i].copy_(experts[i](input_ids, attention_mask).pooler_output)
+            for i in pending:
+                current.wait_stream(self._streams[i])
+        else:
+            for i in pending:
+                slices[i].copy_(experts[i](input_ids, attention_mask).pooler_output)
 
         # Capa de integración
         integrated = self.integration_layer(combined)
@@ -359,48 +744,161 @@ class EnsembleModel(nn.Module):
 
         return logits
 
+    def fuse_experts(self) -> None:
+        """Apila los expertos congelados con arquitectura idéntica para un forward vmap
+
+        Llamar tras mover el modelo a su dispositivo final; no combinar con quantize_experts.
+        Los expertos heterogéneos (p.ej. finbert, biobert) siguen ejecutándose por separado.
+        """
+        groups: Dict[tuple, List[int]] = {}
+        for i, expert in enumerate(self.experts.values()):
+            signature = (type(expert), tuple(
+                (name, tuple(t.shape), t.dtype) for name, t in expert.state_dict().items()
+            ))
+            groups.setdefault(signature, []).append(i)
+
+        experts = list(self.experts.values())
+        self._fused_groups = []
+        for indices in groups.values():
+            if len(indices) < 2:
+                continue
+            members = [experts[i] for i in indices]
+            params, buffers = stack_module_state(members)
+            params = {name: p.detach() for name, p in params.items()}  # Expertos congelados
+            template = copy.deepcopy(members[0]).to("meta")  # Solo aporta la estructura
+            self._fused_groups.append((indices, params, buffers, template))
+
+    def quantize_experts(self) -> None:
+        """Congela los expertos ya entrenados y cuantiza sus nn.Linear a int8
+
+        En GPU usa bitsandbytes (Linear8bitLt); sin él, quantize_dynamic para CPU.
+        integration_layer y classifier siguen en precisión completa para entrenarse encima.
+        """
+        for expert in self.experts.values():
+            expert.eval()
+            expert.requires_grad_(False)
+
+        if bnb is not None and torch.cuda.is_available():
+            for expert in self.experts.values():
+                _replace_linear_int8(expert)
+            self.experts.to("cuda")  # El paso a GPU cuantiza los pesos
+        else:
+            for name, expert in self.experts.items():
+                self.experts[name] = torch.ao.quantization.quantize_dynamic(
+                    expert, {nn.Linear}, dtype=torch.qint8
+                )
+
+def _replace_linear_int8(module: nn.Module) -> None:
+    """Sustituye recursivamente nn.Linear por bnb.nn.Linear8bitLt"""
+    for name, child in module.named_children():
+        if isinstance(child, nn.Linear):
+            quantized = bnb.nn.Linear8bitLt(
+                child.in_features,
+                child.out_features,
+                bias=child.bias is not None,
+                has_fp16_weights=False,
+                threshold=6.0
+            )
+            quantized.weight = bnb.nn.Int8Params(
+                child.weight.data, requires_grad=False, has_fp16_weights=False
+            )
+            if child.bias is not None:
+                quantized.bias = nn.Parameter(child.bias.data, requires_grad=False)
+            setattr(module, name, quantized)
+        else:
+            _replace_linear_int8(child)
+
 class ContinuousLearningPipeline:
     """Pipeline de aprendizaje continuo"""
 
-    def __init__(self, trainer: ModularTrainer):
+    # Errores transitorios que justifican reintentar el ciclo (red, disco; OSError incluye
+    # ConnectionError y TimeoutError)
+    TRANSIENT_ERRORS = (OSError,)
+
+    def __init__(self, trainer: ModularTrainer, retrain_threshold: int = 1000,
+                 max_retries: int = 5):
         self.trainer = trainer
         self.performance_history = []
+        self.data_q: asyncio.Queue = asyncio.Queue()
+        self.retrain_threshold = retrain_threshold  # Ejemplos nuevos que disparan un ciclo
+        self.max_retries = max_retries
 
     async def run_training_loop(self):
-        """Loop principal de entrenamiento continuo"""
-        while True:
+        """Loop principal de entrenamiento continuo (dirigido por llegada de datos)"""
+        # 1. Recopilar nuevos datos en una tarea independiente que alimenta la cola
+        collector = asyncio.create_task(self.collect_new_data())
+        pending: List[Dataset] = []
+        pending_size = 0
+
+        try:
+            while True:
+                batch = await self._next_batch(collector)
+                pending.append(batch)
+                pending_size += len(batch)
+                if pending_size < self.retrain_threshold:
+                    continue
+
+                new_data = concatenate_datasets(pending)
+                pending, pending_size = [], 0
+                await self._run_cycle_with_retry(new_data)
+        finally:
+            collector.cancel()
+
+    async def _next_batch(self, collector: asyncio.Task) -> Dataset:
+        """Espera el siguiente lote; si el productor falla, propaga su excepción"""
+        while not collector.done():
+            get_task = asyncio.create_task(self.data_q.get())
+            await asyncio.wait({get_task, collector}, return_when=asyncio.FIRST_COMPLETED)
+            if get_task.done():
+                return get_task.result()
+            get_task.cancel()
+
+        collector.result()  # Relanza el error del productor, si lo hubo
+        # El productor terminó sin error: solo quedan los lotes de submit_data
+        return await self.data_q.get()
+
+    async def _run_cycle_with_retry(self, new_data: Dataset):
+        """Ejecuta un ciclo reintentando con backoff exponencial solo ante errores transitorios"""
+        for attempt in range(self.max_retries):
             try:
-                # 1. Recopilar nuevos datos
-                new_data = await self.collect_new_data()
-
-                # 2. Evaluar rendimiento actual
-                current_performance = await self.evaluate_performance()
-                self.performance_history.append(current_performance)
-
-                # 3. Identificar módulos que necesitan mejora
-                modules_to_update = self.identify_improvement_targets(current_performance)
-
-                # 4. Entrenar módulos seleccionados
-                for module_name in modules_to_update:
-                    config = self.get_module_config(module_name)
-                    await self.trainer.train_module(config)
-
-                # 5. Validar mejoras
-                new_performance = await self.evaluate_performance()
-
-                if new_performance > current_performance:
-                    logger.info("Performance improved! Deploying updates...")
-                    await self.deploy_updates()
-
-                # Esperar antes del siguiente ciclo
-                await asyncio.sleep(86400)  # 24 horas
-
-            except Exception as e:
-                logger.error(f"Error in training loop: {e}")
-                await asyncio.sleep(3600)  # Retry en 1 hora
-
-    async def collect_new_data(self) -> Dataset:
-        """Recopila nuevos datos para entrenamiento"""
+                await self.run_training_cycle(new_data)
+                return
+            except self.TRANSIENT_ERRORS as e:
+                if attempt == self.max_retries - 1:
+                    logger.error(f"Error in training loop: {e}")
+                    break
+                delay = min(3600, 60 * 2 ** attempt)
+                logger.error(f"Error in training loop: {e} (retry in {delay}s)")
+                await asyncio.sleep(delay)
+        logger.error("Training cycle abandoned after %d retries", self.max_retries)
+
+    async def run_training_cycle(self, new_data: Dataset):
+        """Ciclo de evaluación, reentrenamiento y despliegue"""
+        # 2. Evaluar rendimiento actual
+        current_performance = await self.evaluate_performance()
+        self.performance_history.append(current_performance)
+
+        # 3. Identificar módulos que necesitan mejora
+        modules_to_update = self.identify_improvement_targets(current_performance)
+
+        # 4. Entrenar módulos seleccionados
+        for module_name in modules_to_update:
+            config = self.get_module_config(module_name)
+            await self.trainer.train_module(config, extra_data=new_data)
+
+        # 5. Validar mejoras
+        new_performance = await self.evaluate_performance()
+
+        if new_performance > current_performance:
+            logger.info("Performance improved! Deploying updates...")
+            await self.deploy_updates()
+
+    async def submit_data(self, batch: Dataset):
+        """Encola un lote de datos nuevos (punto de entrada para productores externos)"""
+        await self.data_q.put(batch)
+
+    async def collect_new_data(self):
+        """Recopila nuevos datos para entrenamiento y los encola con submit_data"""
         # Implementar recopilación de datos reales
         pass
 
@@ -424,24 +922,12 @@ async def main():
     jurisdiction_modules = trainer.create_jurisdiction_modules()
     domain_modules = trainer.create_domain_modules()
 
-    # Entrenar módulos en paralelo
-    logger.info("Starting parallel module training...")
-
-    # Entrenar módulos de jurisdicción
-    jurisdiction_tasks = [
-        trainer.train_module(config)
-        for config in jurisdiction_modules.values()
-    ]
-
-    # Entrenar módulos de dominio
-    domain_tasks = [
-        trainer.train_module(config)
-        for config in domain_modules.values()
-    ]
+    # Entrenar módulos en secuencia; el paralelismo es intra-módulo (DDP sobre todas las GPUs)
+    logger.info("Starting module training...")
 
-    # Ejecutar entrenamiento en paralelo
-    all_tasks = jurisdiction_tasks + domain_tasks
-    trained_models = await asyncio.gather(*all_tasks)
+    trained_models = []
+    for config in [*jurisdiction_modules.values(), *domain_modules.values()]:
+        trained_models.append(await trainer.train_module(config))
 
     logger.info(f"Trained {len(trained_models)} modules successfully")
 
@@ -450,9 +936,10 @@ async def main():
     all_modules = {**trainer.trained_modules}
     ensemble_model = integrator.create_ensemble(all_modules)
 
-    # Guardar modelo ensemble
-    torch.save(ensemble_model.state_dict(), "aion_cr_ensemble.pth")
-    logger.info("Ensemble model saved")
+    # Guardar modelo ensemble (solo rank 0)
+    if _is_main_process():
+        torch.save(ensemble_model.state_dict(), "aion_cr_ensemble.pth")
+        logger.info("Ensemble model saved")
 
     # Iniciar pipeline de aprendizaje continuo
     pipeline = ContinuousLearningPipeline(trainer)